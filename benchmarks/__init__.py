@@ -0,0 +1 @@
+"""Performance benchmarks for the portfolio dashboard. Run with `python -m benchmarks.<name>`."""
@@ -0,0 +1,395 @@
+# Benchmark: every dashboard page and the analyzer apps, driven headlessly
+# through Streamlit's AppTest against synthetic data.
+# Run from the repository root:
+#     python -m benchmarks.bench_pages [--quick] [--only csv,finance] [--repeat 5]
+#                                      [--threshold 0.25] [--update-baseline]
+# Each scenario times its first (cold) rerun and the best of the reruns
+# after it, the peak Python heap (tracemalloc) of the cold rerun, where
+# uploads are parsed and summarized, and of a warm one, and the bytes of
+# ForwardMsgs sent to the browser. cold_ms includes tracemalloc's overhead. Results are compared with the baseline
+# file; the run exits non-zero if any metric grew by more than the threshold.
+# The first run, or --update-baseline, writes the baseline.
+# The databases the pages open are created in a temporary directory, and
+# the analyzer apps get a canned Gemini response instead of the network.
+
+import argparse
+import datetime
+import gc
+import importlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+from streamlit.testing.v1 import AppTest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.bench_renewal_scoring import synthetic_leases  # noqa: E402
+from benchmarks.bench_sentiment import synthetic_reviews  # noqa: E402
+
+# --- Configuration ---
+DASHBOARD = os.path.join(REPO_ROOT, "app.py")
+ANALYZER_APPS = ["bible_verifier_app.py", "political_fact_checker_app.py", "premise_challenger_app.py"]
+BASELINE_PATH = os.path.join(REPO_ROOT, "benchmarks", "baseline_pages.json")
+RERUN_TIMEOUT_S = 900
+CSV_ROWS = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+FINANCE_TRANSACTIONS = [10_000, 100_000]
+# Resume token of the finance scenarios' session, which owns the seeded ledger rows
+FINANCE_SESSION = "benchmark-finance-session"
+LEASES = 100_000
+SENTIMENT_REVIEWS = 20_000
+QUICK = {"csv_rows": [1_000, 10_000, 100_000], "finance": [10_000], "leases": 10_000, "reviews": 2_000}
+METRICS = ["cold_ms", "rerun_ms", "cold_peak_mb", "peak_mb", "payload_kb"]
+# A cold rerun is a single sample, so it is allowed this many times the threshold
+COLD_THRESHOLD_FACTOR = 2
+# Differences below these are noise, whatever the ratio
+ABSOLUTE_FLOOR = {"cold_ms": 25.0, "rerun_ms": 25.0, "cold_peak_mb": 2.0, "peak_mb": 2.0, "payload_kb": 2.0}
+
+GEMINI_RESPONSE = {
+    "candidates": [{
+        "content": {"parts": [{"text": "**Verdict:** Benchmark response.\n\n" + "Supporting detail. " * 80}]},
+        "groundingMetadata": {"groundingAttributions": [
+            {"web": {"uri": f"https://example.com/source/{i}", "title": f"Source {i}"}} for i in range(5)
+        ]},
+    }]
+}
+
+
+class StubGeminiResponse:
+    """Stands in for the requests.Response of a successful generateContent call."""
+
+    status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return GEMINI_RESPONSE
+
+
+class PayloadCounter:
+    """Bytes of every ForwardMsg the script enqueues for the browser."""
+
+    def __init__(self):
+        self.bytes = 0
+        ForwardMsgQueue.on_before_enqueue_msg(self._count)
+
+    def _count(self, msg):
+        self.bytes += msg.ByteSize()
+
+    def reset(self):
+        self.bytes = 0
+
+
+class Scenario:
+    """
+    One benchmark case.
+
+    `prepare` returns an AppTest sitting on the state before the measured
+    interaction, and `act` applies that interaction (upload, click, page
+    switch) without running it. With `repeat_act`, the interaction is
+    applied again before every warm rerun (button clicks do not stick).
+    """
+
+    def __init__(self, name: str, prepare: Callable[[], AppTest],
+                 act: Optional[Callable[[AppTest], None]] = None, repeat_act: bool = False):
+        self.name = name
+        self.prepare = prepare
+        self.act = act or (lambda at: None)
+        self.repeat_act = repeat_act
+
+
+# --- Synthetic data ---
+
+def synthetic_csv(rows: int, seed: int = 0, chunk_rows: int = 1_000_000) -> bytes:
+    """An analyzer upload: an id, a category, and three numeric columns, written in chunks."""
+    rng = np.random.default_rng(seed)
+    output = io.StringIO()
+    for start in range(0, rows, chunk_rows):
+        size = min(chunk_rows, rows - start)
+        pd.DataFrame({
+            "id": np.arange(start, start + size),
+            "region": rng.choice(["north", "south", "east", "west"], size),
+            "amount": rng.gamma(2.0, 50.0, size).round(2),
+            "quantity": rng.integers(1, 20, size),
+            "score": rng.normal(0.0, 1.0, size).round(4),
+        }).to_csv(output, header=start == 0, index=False)
+    return output.getvalue().encode("utf-8")
+
+
+def synthetic_transactions(count: int, seed: int = 0) -> pd.DataFrame:
+    """About three years of ledger rows, one in ten of them income."""
+    rng = np.random.default_rng(seed)
+    income = rng.random(count) < 0.1
+    expense_categories = ["Groceries", "Rent", "Utilities", "Transport", "Entertainment", "Other Expense"]
+    days = pd.Timestamp.today().normalize() - pd.to_timedelta(rng.integers(0, 3 * 365, count), unit="D")
+    amounts = np.where(income, rng.gamma(3.0, 800.0, count), -rng.gamma(2.0, 40.0, count)).round(2)
+    return pd.DataFrame({
+        "Date": days.strftime("%Y-%m-%d"),
+        "Type": np.where(income, "Income", "Expense"),
+        "Amount": amounts,
+        "Category": np.where(income, rng.choice(["Salary", "Investment"], count),
+                             rng.choice(expense_categories, count)),
+        "Description": "Synthetic",
+    })
+
+
+def seed_ledger(count: int):
+    """Grow the benchmark session's ledger to `count` transactions."""
+    from finance_tracker.ledger import Ledger
+
+    ledger = Ledger()
+    missing = count - ledger.totals(FINANCE_SESSION)["count"]
+    if missing > 0:
+        ledger.add_many(FINANCE_SESSION, synthetic_transactions(missing, seed=count))
+
+
+def seed_leases(count: int):
+    """Fill the lease repository with `count` synthetic leases and build today's queues."""
+    from leasesync.expiry import ensure_schema, run_renewal_job
+    from leasesync.repository import LeaseRepository
+
+    repo = LeaseRepository()
+    leases = synthetic_leases(count)
+    leases["name"] = "Tenant " + leases["tenant_id"].astype(str)
+    leases["status"] = np.random.default_rng(1).choice(["Active", "Pending Renewal", "Notice Given"], count)
+    repo.upsert(leases)
+    ensure_schema(repo)
+    # The page's scheduler thread then finds today's run done and stays idle
+    run_renewal_job(repo, force=True)
+
+
+# --- App drivers ---
+
+def dashboard(page_prefix: Optional[str] = None, session: Optional[str] = None) -> AppTest:
+    """The dashboard after its first run, optionally already on a page or resuming a session token."""
+    at = AppTest.from_file(DASHBOARD, default_timeout=RERUN_TIMEOUT_S)
+    if session:
+        at.query_params["session"] = session
+    at.run()
+    if page_prefix:
+        go_to(at, page_prefix)
+        at.run()
+    return at
+
+
+def go_to(at: AppTest, page_prefix: str):
+    """Select the sidebar page whose label starts with the prefix (e.g. '5.')."""
+    radio = at.sidebar.radio[0]
+    radio.set_value(next(option for option in radio.options if option.startswith(page_prefix)))
+
+
+def click(at: AppTest, label: str):
+    next(button for button in at.button if button.label == label).click()
+
+
+def analyzer(script: str) -> AppTest:
+    at = AppTest.from_file(os.path.join(REPO_ROOT, script), default_timeout=RERUN_TIMEOUT_S)
+    at.secrets["tool_auth"] = {"gemini_api_key": "benchmark"}
+    at.run()
+    at.text_area[0].input("Remote work increases overall employee productivity.")
+    return at
+
+
+def build_scenarios(args) -> List[Scenario]:
+    csv_rows = args.csv_rows or (QUICK["csv_rows"] if args.quick else CSV_ROWS)
+    finance_sizes = QUICK["finance"] if args.quick else FINANCE_TRANSACTIONS
+    lease_count = QUICK["leases"] if args.quick else LEASES
+    review_count = QUICK["reviews"] if args.quick else SENTIMENT_REVIEWS
+
+    scenarios = [
+        Scenario("welcome", lambda: AppTest.from_file(DASHBOARD, default_timeout=RERUN_TIMEOUT_S)),
+        Scenario("web-scraper", dashboard, lambda at: go_to(at, "2.")),
+        Scenario("sentiment-text", lambda: dashboard("3."),
+                 lambda at: at.text_area(key="sentiment_review").input("Great product, really fast shipping!")),
+        Scenario(f"sentiment-batch-{review_count}", lambda: sentiment_batch(review_count),
+                 lambda at: click(at, "Score File"), repeat_act=True),
+        Scenario("quiz", dashboard, lambda at: go_to(at, "4.")),
+        Scenario("quiz-answer", lambda: dashboard("4."),
+                 lambda at: click(at, "Next Question"), repeat_act=True),
+    ]
+    for rows in csv_rows:
+        scenarios.append(Scenario(f"csv-{rows}", lambda: dashboard("1."), lambda at, rows=rows: at.get(
+            "file_uploader")[0].upload(f"synthetic_{rows}.csv", synthetic_csv(rows), "text/csv")))
+    for count in finance_sizes:
+        scenarios.append(Scenario(f"finance-{count}",
+                                  lambda count=count: seeded(finance_dashboard, seed_ledger, count),
+                                  lambda at: go_to(at, "5.")))
+    scenarios.append(Scenario(f"leasesync-{lease_count}",
+                              lambda: seeded(dashboard, seed_leases, lease_count),
+                              lambda at: go_to(at, "6.")))
+    for script in ANALYZER_APPS:
+        scenarios.append(Scenario(f"analyzer-{script[:-len('_app.py')]}", lambda script=script: analyzer(script),
+                                  lambda at: at.button[0].click(), repeat_act=True))
+    return scenarios
+
+
+def finance_dashboard() -> AppTest:
+    return dashboard(session=FINANCE_SESSION)
+
+
+def seeded(prepare: Callable[[], AppTest], seed: Callable[[int], None], count: int) -> AppTest:
+    seed(count)
+    return prepare()
+
+
+def sentiment_batch(reviews: int) -> AppTest:
+    at = dashboard("3.")
+    data = pd.DataFrame({"review": synthetic_reviews(reviews)}).to_csv(index=False).encode("utf-8")
+    at.get("file_uploader")[0].upload("reviews.csv", data, "text/csv")
+    at.run()
+    at.radio(key="sentiment_scorer").set_value("Fast lexicon")
+    return at
+
+
+# --- Measurement ---
+
+def import_pages():
+    """
+    Import every page module up front, so a scenario's cold rerun measures
+    the page's first run and not whichever module imports it happened to
+    trigger first.
+    """
+    from app import PAGES
+
+    for page in PAGES.values():
+        if isinstance(page, str):
+            importlib.import_module(page)
+
+
+def measure(scenario: Scenario, repeat: int, payload: PayloadCounter) -> Dict[str, float]:
+    """
+    cold_ms, rerun_ms (best warm rerun), cold_peak_mb and peak_mb (tracemalloc,
+    cold and warm rerun) and payload_kb (cold rerun).
+    """
+    at = scenario.prepare()
+
+    scenario.act(at)
+    gc.collect()
+    payload.reset()
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        at.run()
+        cold_ms = (time.perf_counter() - start) * 1000
+        cold_peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        tracemalloc.stop()
+    payload_kb = payload.bytes / 1024
+    if at.exception:
+        raise RuntimeError(f"{scenario.name}: {at.exception[0].message}")
+
+    timings = []
+    for _ in range(repeat):
+        if scenario.repeat_act:
+            scenario.act(at)
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    if scenario.repeat_act:
+        scenario.act(at)
+    tracemalloc.start()
+    try:
+        at.run()
+        peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "cold_ms": round(cold_ms, 1),
+        "rerun_ms": round(min(timings), 1) if timings else round(cold_ms, 1),
+        "cold_peak_mb": round(cold_peak_mb, 2),
+        "peak_mb": round(peak_mb, 2),
+        "payload_kb": round(payload_kb, 1),
+    }
+
+
+def regressions(current: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    """Metrics that grew by more than `threshold` (a fraction) and by more than the noise floor."""
+    worse = []
+    for metric in METRICS:
+        before, now = baseline.get(metric), current[metric]
+        if before is None:
+            continue
+        allowed = threshold * (COLD_THRESHOLD_FACTOR if metric == "cold_ms" else 1)
+        if now > before * (1 + allowed) and now - before > ABSOLUTE_FLOOR[metric]:
+            worse.append(f"{metric} {before:g} -> {now:g}")
+    return worse
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard pages and analyzer apps with AppTest.")
+    parser.add_argument("--quick", action="store_true", help="smaller data sets (CSV up to 1e5 rows)")
+    parser.add_argument("--csv-rows", type=lambda value: [int(float(v)) for v in value.split(",")],
+                        help="comma-separated CSV sizes, e.g. 1e3,1e6")
+    parser.add_argument("--only", help="comma-separated substrings of the scenario names to run")
+    parser.add_argument("--repeat", type=int, default=5, help="warm reruns per scenario")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed growth over the baseline (0.25 = 25%%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    baseline_path = os.path.abspath(args.baseline)
+    baseline = {}
+    if os.path.exists(baseline_path):
+        with open(baseline_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+    reference = baseline.get("scenarios", {})
+
+    scenarios = build_scenarios(args)
+    if args.only:
+        wanted = [part.strip() for part in args.only.split(",") if part.strip()]
+        scenarios = [s for s in scenarios if any(part in s.name for part in wanted)]
+
+    payload = PayloadCounter()
+    import_pages()
+
+    results, failed = {}, []
+    print(f"{'scenario':<34}{'cold ms':>10}{'rerun ms':>10}{'cold MB':>10}{'peak MB':>10}{'payload KB':>12}")
+    with tempfile.TemporaryDirectory(prefix="bench_pages_", ignore_cleanup_errors=True) as workdir, \
+            mock.patch("requests.post", return_value=StubGeminiResponse()):
+        os.chdir(workdir)
+        for scenario in scenarios:
+            result = measure(scenario, args.repeat, payload)
+            results[scenario.name] = result
+            worse = regressions(result, reference.get(scenario.name, {}), args.threshold)
+            if worse:
+                failed.append((scenario.name, worse))
+            print(f"{scenario.name:<34}{result['cold_ms']:>10.1f}{result['rerun_ms']:>10.1f}"
+                  f"{result['cold_peak_mb']:>10.1f}{result['peak_mb']:>10.1f}{result['payload_kb']:>12.1f}" + ("  REGRESSED" if worse else ""))
+        os.chdir(REPO_ROOT)
+
+    if args.update_baseline or not reference:
+        baseline = {
+            "updated_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "machine": f"{platform.platform()} / {platform.python_version()} / {os.cpu_count()} CPUs",
+            "scenarios": {**reference, **results},
+        }
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"baseline written to {baseline_path}")
+    else:
+        new = [name for name in results if name not in reference]
+        if new:
+            print(f"not in the baseline (run with --update-baseline to add): {', '.join(new)}")
+
+    for name, worse in failed:
+        print(f"regression in {name}: {'; '.join(worse)}")
+    if failed and not args.update_baseline:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
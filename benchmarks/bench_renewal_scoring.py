@@ -0,0 +1,68 @@
+# Benchmark: LeaseSync renewal scoring over a large synthetic portfolio.
+# Run from the repository root:
+#     python -m benchmarks.bench_renewal_scoring [--rows 1000000] [--budget 1.0]
+# Exits non-zero if the best run exceeds the budget or the vectorized scores
+# disagree with the original per-row implementation.
+
+import argparse
+import datetime
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from leasesync.scoring import score_renewals
+
+
+def synthetic_leases(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Leases ending anywhere from a year ago to three years out."""
+    rng = np.random.default_rng(seed)
+    today = pd.Timestamp.today().normalize()
+    ends = today + pd.to_timedelta(rng.integers(-365, 3 * 365, rows), unit="D")
+    return pd.DataFrame({
+        "tenant_id": np.arange(rows),
+        "name": "Tenant",
+        "lease_end": ends.strftime("%Y-%m-%d"),
+        "rent": rng.integers(800, 5000, rows),
+        "status": "Active",
+    })
+
+
+def reference_scores(leases: pd.DataFrame, now: datetime.datetime) -> list:
+    """The original per-row implementation, kept here to check equivalence."""
+    days = [(datetime.datetime.strptime(date, "%Y-%m-%d") - now).days for date in leases["lease_end"]]
+    return [80 if d < 60 else 50 for d in days]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LeaseSync renewal scoring.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=1.0, help="seconds allowed for the best run")
+    args = parser.parse_args()
+
+    leases = synthetic_leases(args.rows)
+    now = datetime.datetime.now()
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        score_renewals(leases, now=now)
+        timings.append(time.perf_counter() - start)
+
+    check = leases.head(50_000)
+    matches = (score_renewals(check, now=now)["renewal_chance"].tolist() == reference_scores(check, now))
+    untouched = "renewal_chance" not in leases.columns
+
+    best = min(timings)
+    print(f"rows={args.rows:,} best={best * 1000:.1f} ms median={np.median(timings) * 1000:.1f} ms "
+          f"({args.rows / best / 1e6:.1f}M leases/s)")
+    print(f"matches per-row reference: {matches}; input left unmodified: {untouched}")
+
+    if not matches or not untouched or best > args.budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
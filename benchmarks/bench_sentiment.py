@@ -0,0 +1,94 @@
+# Benchmark: fast lexicon sentiment scorer against TextBlob.
+# Run from the repository root:
+#     python -m benchmarks.bench_sentiment [--rows 20000] [--min-speedup 10]
+# Exits non-zero if fast polarity drifts from TextBlob beyond the tolerance
+# or the fast path is not at least --min-speedup times quicker.
+
+import argparse
+import sys
+import time
+
+import numpy as np
+from textblob import TextBlob
+
+from sentiment_analyzer.fast import score_fast, score_sentence
+
+ADJECTIVES = ["great", "good", "terrible", "awful", "nice", "bad", "amazing", "poor", "excellent", "slow",
+              "fast", "cheap", "perfect", "horrible", "okay", "disappointing", "happy", "beautiful",
+              "broken", "useless", "fantastic", "wonderful", "boring"]
+MODIFIERS = ["very", "really", "extremely", "not", "never", "quite", "so", "totally", "not very",
+             "incredibly", "somewhat", "hardly", ""]
+NOUNS = ["product", "shipping", "service", "quality", "price", "battery", "screen", "seller", "delivery"]
+ENDINGS = [".", "!", "!!", "...", "", ". :)", " :(", "?"]
+# Stock phrases make up a large share of real review exports.
+STOCK = ["Great product!", "Fast shipping.", "Would buy again.", "Not as described.", "Love it!"]
+
+
+def synthetic_reviews(rows: int, seed: int = 0) -> list:
+    """One to three short sentences per review, mixing stock phrases with templated ones."""
+    rng = np.random.default_rng(seed)
+
+    def pick(options):
+        return options[rng.integers(len(options))]
+
+    reviews = []
+    for _ in range(rows):
+        sentences = []
+        for _ in range(rng.integers(1, 4)):
+            template = rng.integers(0, 6)
+            adjective, modifier, noun = pick(ADJECTIVES), pick(MODIFIERS), pick(NOUNS)
+            if template == 0:
+                sentence = pick(STOCK)
+            elif template == 1:
+                sentence = f"The {noun} is {modifier} {adjective}".replace("  ", " ") + pick(ENDINGS)
+            elif template == 2:
+                sentence = f"I don't think the {noun} was {adjective}" + pick(ENDINGS)
+            elif template == 3:
+                sentence = f"{modifier} {adjective} {noun}, would buy again".strip().capitalize() + pick(ENDINGS)
+            elif template == 4:
+                sentence = f"It's {modifier} {adjective} and the {noun} isn't {pick(ADJECTIVES)}" + pick(ENDINGS)
+            else:
+                sentence = f"{adjective.capitalize()} {noun}" + pick(ENDINGS)
+            sentences.append(sentence)
+        reviews.append(" ".join(sentences))
+    return reviews
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the fast sentiment scorer against TextBlob.")
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--tolerance", type=float, default=1e-6,
+                        help="largest polarity difference counted as a match")
+    parser.add_argument("--min-match", type=float, default=0.995,
+                        help="fraction of reviews that must match within the tolerance")
+    parser.add_argument("--max-mean-error", type=float, default=1e-3)
+    parser.add_argument("--min-speedup", type=float, default=10.0)
+    args = parser.parse_args()
+
+    texts = synthetic_reviews(args.rows)
+
+    start = time.perf_counter()
+    reference = np.array([TextBlob(text).sentiment for text in texts])
+    textblob_s = time.perf_counter() - start
+
+    # Cold: empty sentence cache, as for the first file scored by a worker.
+    score_sentence.cache_clear()
+    start = time.perf_counter()
+    fast = score_fast(texts)
+    fast_s = time.perf_counter() - start
+
+    error = np.abs(fast[:, 0] - reference[:, 0])
+    matched = float((error <= args.tolerance).mean())
+    subjectivity_error = float(np.abs(fast[:, 1] - reference[:, 1]).max())
+    speedup = textblob_s / fast_s
+    print(f"rows={args.rows:,} textblob={textblob_s:.2f}s fast={fast_s:.2f}s speedup={speedup:.1f}x "
+          f"(cache: {score_sentence.cache_info().currsize:,} distinct sentences)")
+    print(f"polarity within {args.tolerance:g}: {matched:.2%}; mean abs error {error.mean():.2e}; "
+          f"max abs error {error.max():.3f}; max subjectivity error {subjectivity_error:.2e}")
+
+    if matched < args.min_match or error.mean() > args.max_mean_error or speedup < args.min_speedup:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ import json
 import time
 from typing import Dict, Any, List
 
+from profiling import profiled_cache, profiled_rerun
+
 # --- Configuration ---
 # Read the API key from the standard Streamlit secrets configuration
 # NOTE: If you are running this locally, you must have the .streamlit/secrets.toml file setup.
@@ -15,8 +17,8 @@ MAX_RETRIES = 5
 
 # --- Core LLM Function with Google Search Grounding ---
 
-# Use st.cache_data to remember results for the same input, saving time and API calls
-@st.cache_data(show_spinner=False)
+# Cached with st.cache_data to remember results for the same input, saving time and API calls
+@profiled_cache(show_spinner=False)
 def verify_claim(claim: str) -> Dict[str, Any]:
     """
     Sends a claim to the Gemini model with Google Search enabled to ground the response
@@ -154,4 +156,6 @@ def main():
             st.warning("Please enter a claim to begin analysis.")
 
 if __name__ == "__main__":
-    main()
+    # Opt-in rerun profiling (?profile=1), see profiling.py
+    with profiled_rerun("bible_verifier"):
+        main()
@@ -0,0 +1 @@
+"""Helpers behind the CSV Data Analyzer page (Project 1)."""
@@ -0,0 +1,182 @@
+# Input formats for the CSV Data Analyzer.
+# CSV and JSON Lines are text and must be parsed in full. Parquet and
+# Feather/Arrow IPC uploads are spooled to disk once, memory-mapped, and read
+# column by column, so each analyzer section only touches the columns it shows.
+
+import os
+import tempfile
+import weakref
+from typing import List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+
+from profiling import profiled_cache
+
+# --- Configuration ---
+# Extensions accepted by the uploader, and the reader each one maps to.
+FORMAT_BY_EXTENSION = {
+    "csv": "csv",
+    "jsonl": "jsonl",
+    "ndjson": "jsonl",
+    "parquet": "parquet",
+    "feather": "arrow",
+    "arrow": "arrow",
+    "ipc": "arrow",
+}
+SUPPORTED_TYPES = list(FORMAT_BY_EXTENSION)
+
+
+def file_format(filename: str) -> str:
+    """Map an uploaded file name to one of: csv, jsonl, parquet, arrow."""
+    extension = os.path.splitext(filename)[1].lstrip(".").lower()
+    if extension not in FORMAT_BY_EXTENSION:
+        raise ValueError(f"Unsupported file type '.{extension}'.")
+    return FORMAT_BY_EXTENSION[extension]
+
+
+class FrameSource:
+    """A text file (CSV, JSON Lines) that has already been parsed into a DataFrame."""
+
+    def __init__(self, data: pd.DataFrame, summary: Optional[pd.DataFrame] = None):
+        self._data = data
+        self._summary = summary
+
+    @property
+    def num_rows(self) -> int:
+        return len(self._data)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._data.columns)
+
+    @property
+    def dtypes(self) -> pd.Series:
+        return self._data.dtypes
+
+    @property
+    def numeric_columns(self) -> List[str]:
+        return self._data.select_dtypes(include=['number']).columns.tolist()
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        return self._data.head(n)
+
+    def read(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        return self._data if columns is None else self._data[columns]
+
+    def describe(self) -> pd.DataFrame:
+        return self._summary if self._summary is not None else self._data.describe()
+
+
+class ArrowSource:
+    """
+    A Parquet or Feather/Arrow IPC file read lazily from a memory map.
+
+    Row counts, column names and types come from file metadata; column data
+    is only materialized when a section asks for it.
+    """
+
+    def __init__(self, path: str, fmt: str):
+        self.path = path
+        self.format = fmt
+        if fmt == "parquet":
+            self._parquet = pq.ParquetFile(path, memory_map=True)
+            self.schema = self._parquet.schema_arrow
+            self._num_rows = self._parquet.metadata.num_rows
+        else:
+            # Opening an IPC file only reads its footer; compressed (LZ4/ZSTD)
+            # column buffers are decompressed by the read that selects them.
+            self._reader = pa.ipc.open_file(pa.memory_map(path))
+            self.schema = self._reader.schema
+            self._num_rows = self._count_ipc_rows()
+
+    @property
+    def num_rows(self) -> int:
+        return self._num_rows
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.schema.names)
+
+    @property
+    def dtypes(self) -> pd.Series:
+        return self.schema.empty_table().to_pandas().dtypes
+
+    @property
+    def numeric_columns(self) -> List[str]:
+        return [
+            field.name for field in self.schema
+            if pa.types.is_integer(field.type) or pa.types.is_floating(field.type)
+            or pa.types.is_decimal(field.type)
+        ]
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        # Record batches (and Parquet row groups) can hold fewer than n rows,
+        # so keep reading them in order until there are enough.
+        if self.format == "parquet":
+            batches = self._parquet.iter_batches(batch_size=n)
+        else:
+            batches = (self._reader.get_batch(i) for i in range(self._reader.num_record_batches))
+        collected, rows = [], 0
+        for batch in batches:
+            if rows >= n:
+                break
+            collected.append(batch)
+            rows += batch.num_rows
+        return pa.Table.from_batches(collected, schema=self.schema).slice(0, n).to_pandas()
+
+    def read(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        if self.format == "parquet":
+            return self._parquet.read(columns=columns).to_pandas()
+        if columns is None:
+            return self._reader.read_all().to_pandas()
+        return self._read_ipc_fields([self.schema.get_field_index(c) for c in columns]).select(columns).to_pandas()
+
+    def describe(self) -> pd.DataFrame:
+        numeric = self.numeric_columns
+        # DataFrame.describe() over no numeric columns summarizes the object ones instead.
+        return self.read(numeric).describe() if numeric else self.read().describe()
+
+    def _read_ipc_fields(self, indices: List[int]) -> pa.Table:
+        """Read only the given top-level fields of the IPC file (an empty list reads none)."""
+        if not indices:
+            return self.schema.empty_table().select([])
+        options = pa.ipc.IpcReadOptions(included_fields=indices)
+        return pa.ipc.open_file(pa.memory_map(self.path), options=options).read_all()
+
+    def _count_ipc_rows(self) -> int:
+        """Row count from the smallest possible read: one column of every record batch."""
+        if not self.schema.names:
+            return 0
+        return self._read_ipc_fields([0]).num_rows
+
+
+@profiled_cache(st.cache_resource, max_entries=4, show_spinner=False)
+def _open_columnar(cache_key: str, _uploaded_file, fmt: str) -> ArrowSource:
+    """Spool a columnar upload to a temp file once and memory-map it."""
+    suffix = os.path.splitext(_uploaded_file.name)[1]
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as spool:
+        spool.write(_uploaded_file.getbuffer())
+    source = ArrowSource(spool.name, fmt)
+    # Remove the spooled file once the cache evicts the source.
+    weakref.finalize(source, os.remove, spool.name)
+    return source
+
+
+@profiled_cache(st.cache_resource, max_entries=4, show_spinner=False)
+def _open_text(cache_key: str, _uploaded_file, fmt: str) -> FrameSource:
+    """Parse a CSV or JSON Lines upload once; later reruns reuse the parsed frame."""
+    _uploaded_file.seek(0)
+    if fmt == "csv":
+        return FrameSource(pd.read_csv(_uploaded_file))
+    return FrameSource(pd.read_json(_uploaded_file, lines=True))
+
+
+def open_upload(uploaded_file, cache_key: str):
+    """Return a FrameSource or ArrowSource for any supported upload, cached per cache_key."""
+    fmt = file_format(uploaded_file.name)
+    if fmt in ("csv", "jsonl"):
+        return _open_text(cache_key, uploaded_file, fmt)
+    return _open_columnar(cache_key, uploaded_file, fmt)
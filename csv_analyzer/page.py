@@ -0,0 +1,120 @@
+# CSV Data Analyzer page (Project 1).
+# Loaded by app.py the first time the page is opened.
+
+import pandas as pd
+import streamlit as st
+
+from csv_analyzer.formats import SUPPORTED_TYPES, FrameSource, file_format, open_upload
+from csv_analyzer.progressive import exact_ready, exact_result, render_progressive_preview
+from csv_analyzer.sql_panel import render_query_panel
+from profiling import section
+
+
+def render():
+    """Container for the CSV Data Analyzer project (Project 1)."""
+    # --- Title and Uploader (Always visible to prevent blank page) ---
+    st.title("1. 📊 CSV Data Analyzer (Pandas)")
+    st.markdown("Upload a CSV file to instantly analyze its structure, statistics, and column data.")
+
+    uploaded_file = st.file_uploader(
+        "Choose a CSV file:", 
+        type=SUPPORTED_TYPES,
+        help="The file should be comma-separated, like a spreadsheet export. "
+             "Parquet, Feather/Arrow IPC and JSON Lines files are also accepted."
+    )
+
+    progressive_mode = st.toggle(
+        "Progressive mode (instant sample-based preview for large files)",
+        key="progressive_mode"
+    )
+
+    # Progressive mode only applies to CSV; columnar formats are already near-instant
+    progressive_mode = progressive_mode and uploaded_file is not None and file_format(uploaded_file.name) == "csv"
+
+    # --- Main Analysis Logic ---
+    if uploaded_file is not None and progressive_mode and not exact_ready(uploaded_file):
+        try:
+            # Approximate sections now; exact results replace them when the background parse ends
+            render_progressive_preview(uploaded_file)
+        except Exception as e:
+            st.error(f"An error occurred during file processing: {e}")
+
+    elif uploaded_file is not None:
+        try:
+            # Open the upload; columnar formats are memory-mapped and read per column
+            # (progressive mode reuses the parse and describe() done in the background)
+            cache_key = f"{uploaded_file.name}:{uploaded_file.size}:{uploaded_file.file_id}"
+            with section("read upload"):
+                if progressive_mode:
+                    source = FrameSource(*exact_result(uploaded_file))
+                else:
+                    source = open_upload(uploaded_file, cache_key)
+        
+            st.success("File uploaded and read successfully!")
+
+            st.header("1. Data Overview")
+            st.markdown(f"**Total Rows:** {source.num_rows}")
+            st.markdown(f"**Total Columns:** {len(source.columns)}")
+            st.markdown("---")
+        
+            # Display the first few rows of the data
+            st.subheader("First 5 Rows")
+            with section("head"):
+                st.dataframe(source.head())
+        
+            # Display column information
+            st.subheader("Column Data Types")
+            col_info = pd.DataFrame(source.dtypes, columns=['Data Type'])
+            st.dataframe(col_info)
+        
+            st.header("2. Descriptive Statistics")
+            st.markdown("Summary statistics for all numerical columns:")
+            with section("describe"):
+                st.dataframe(source.describe())
+
+            st.header("3. Interactive Data Visualizer")
+        
+            # --- Interactive Plotting Section ---
+        
+            numerical_cols = source.numeric_columns
+        
+            if numerical_cols:
+                col1, col2 = st.columns(2)
+            
+                with col1:
+                    # Select a column for plotting
+                    selected_column = st.selectbox(
+                        "Select a column to visualize:",
+                        numerical_cols
+                    )
+            
+                with col2:
+                    # Select plot type
+                    plot_type = st.selectbox(
+                        "Select plot type:",
+                        ["Histogram", "Box Plot"]
+                    )
+
+                # Generate the chart based on user selection (reads only that column)
+                st.subheader(f"Visualization: {selected_column}")
+                with section("chart"):
+                    column_data = source.read([selected_column])[selected_column]
+
+                    if plot_type == "Histogram":
+                        st.bar_chart(column_data)
+                    elif plot_type == "Box Plot":
+                        # Using Streamlit's simple plotting for a box plot representation
+                        st.area_chart(column_data)
+            else:
+                st.info("No numerical columns found for plotting.")
+
+            # --- SQL Query Panel ---
+            with section("SQL panel"):
+                render_query_panel(source.read, cache_key)
+
+        except Exception as e:
+            st.error(f"An error occurred during file processing: {e}")
+
+    # This message appears when no file is uploaded
+    else:
+        st.info("Upload a CSV file above to begin analysis.")
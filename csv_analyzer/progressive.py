@@ -0,0 +1,209 @@
+# Progressive analysis mode for the CSV Data Analyzer.
+# Rows are sampled from random byte offsets across the whole upload and
+# rendered straight away, with finite-population confidence intervals on
+# each mean, while the exact parse and describe() run on a background
+# thread and replace the preview when ready.
+
+import io
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from statistics import NormalDist
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# --- Configuration ---
+SAMPLE_SIZE = 10_000
+CONFIDENCE = 0.95
+POLL_INTERVAL_S = 0.5
+
+# Exact analyses run here so the script thread can render the preview immediately.
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="csv-exact")
+
+
+def random_sample(raw: bytes, sample_size: int = SAMPLE_SIZE, seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Sample rows from across the whole CSV by seeking to random byte offsets.
+
+    Each offset is moved to the start of the next line and that line is
+    taken, so the cost depends on the sample size, not the file size. The
+    lines are parsed in one read_csv call, and the row count is estimated as
+    the data bytes divided by the mean sampled line length. A file with
+    fewer than twice `sample_size` rows is parsed whole instead: its row
+    count is exact and the sample is drawn from the parsed rows.
+
+    A line is picked with probability proportional to the length of the
+    line before it, which is close to uniform for machine-written CSVs.
+    Lines inside quoted multi-line fields can be misread; malformed ones
+    are skipped.
+    """
+    start = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    head = pd.read_csv(io.BytesIO(raw), nrows=5)
+    header_end = raw.find(b"\n") + 1 or len(raw)
+
+    lines = {}
+    if header_end < len(raw):
+        # An offset on the header's own newline selects the first data line.
+        for offset in rng.integers(header_end - 1, len(raw), sample_size).tolist():
+            begin = raw.find(b"\n", offset) + 1
+            if begin == 0 or begin >= len(raw) or begin in lines:
+                continue
+            end = raw.find(b"\n", begin)
+            lines[begin] = raw[begin:len(raw) if end == -1 else end]
+    mean_line_bytes = sum(len(line) + 1 for line in lines.values()) / max(len(lines), 1)
+    estimated_rows = round((len(raw) - header_end) / mean_line_bytes) if lines else 0
+
+    if estimated_rows < 2 * sample_size:
+        data = pd.read_csv(io.BytesIO(raw))
+        sample = data.sample(min(sample_size, len(data)), random_state=rng).reset_index(drop=True)
+        total_rows, exact = len(data), True
+    else:
+        sample = pd.read_csv(io.BytesIO(b"\n".join(lines.values())), header=None, names=list(head.columns),
+                             on_bad_lines="skip")
+        total_rows, exact = estimated_rows, False
+
+    return {
+        "sample": sample,
+        "head": head,
+        "total_rows": total_rows,
+        "rows_exact": exact,
+        "elapsed_s": time.perf_counter() - start,
+    }
+
+
+def approximate_describe(sample: pd.DataFrame, population_rows: int,
+                         confidence: float = CONFIDENCE) -> pd.DataFrame:
+    """
+    describe()-style summary of a sample, with a confidence interval on each mean.
+
+    Intervals use the normal approximation with a finite population correction.
+    """
+    numeric = sample.select_dtypes(include=["number"])
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    n = numeric.count()
+    mean = numeric.mean()
+    std = numeric.std()
+    fpc = np.sqrt(np.clip((population_rows - n) / max(population_rows - 1, 1), 0, 1))
+    margin = z * std / np.sqrt(n.clip(lower=1)) * fpc
+    pct = int(confidence * 100)
+
+    summary = pd.DataFrame({
+        "count (est.)": (n / max(len(sample), 1) * population_rows).round(),
+        "mean": mean,
+        f"mean {pct}% CI low": mean - margin,
+        f"mean {pct}% CI high": mean + margin,
+        "std": std,
+        "min": numeric.min(),
+        "25%": numeric.quantile(0.25),
+        "50%": numeric.quantile(0.50),
+        "75%": numeric.quantile(0.75),
+        "max": numeric.max(),
+    })
+    return summary.T
+
+
+def _exact_analysis(raw: bytes) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Full parse and describe(), run on the background executor."""
+    data = pd.read_csv(io.BytesIO(raw))
+    return data, data.describe()
+
+
+def _job_for(uploaded_file) -> Optional[Dict[str, Any]]:
+    """The progressive job for this upload, if one has been started this session."""
+    job = st.session_state.get("progressive_job")
+    if job and job["key"] == uploaded_file.file_id:
+        return job
+    return None
+
+
+def exact_ready(uploaded_file) -> bool:
+    """True once the background exact analysis for this upload has finished."""
+    job = _job_for(uploaded_file)
+    return job is not None and job["future"].done()
+
+
+def exact_result(uploaded_file) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """The exact (data, describe) pair; re-raises any parse error from the worker."""
+    return _job_for(uploaded_file)["future"].result()
+
+
+def render_progressive_preview(uploaded_file):
+    """
+    Draws the approximate Overview, Statistics and Visualizer sections.
+
+    The first call for an upload samples it and starts the exact analysis;
+    a polling fragment reruns the page once the exact results are in.
+    """
+    job = _job_for(uploaded_file)
+    if job is None:
+        raw = uploaded_file.getvalue()
+        future: Future = _EXECUTOR.submit(_exact_analysis, raw)
+        job = {
+            "key": uploaded_file.file_id,
+            "future": future,
+            "preview": random_sample(raw),
+        }
+        st.session_state.progressive_job = job
+
+    preview = job["preview"]
+    sample = preview["sample"]
+    total_rows = preview["total_rows"]
+
+    if preview["rows_exact"]:
+        st.info(
+            f"⚡ Approximate preview from a random sample of {len(sample):,} of the file's "
+            f"{total_rows:,} rows (drawn in {preview['elapsed_s'] * 1000:.0f} ms). "
+            "Exact results will replace it automatically."
+        )
+    else:
+        st.info(
+            f"⚡ Approximate preview from {len(sample):,} rows sampled across the whole file "
+            f"(about {total_rows:,} rows, estimated from the sampled line lengths; drawn in "
+            f"{preview['elapsed_s'] * 1000:.0f} ms). Exact results will replace it automatically."
+        )
+    _poll_exact(uploaded_file)
+
+    st.header("1. Data Overview (approximate)")
+    if preview["rows_exact"]:
+        st.markdown(f"**Total Rows:** {total_rows:,}")
+    else:
+        st.markdown(f"**Total Rows:** about {total_rows:,} (estimated)")
+    st.markdown(f"**Total Columns:** {len(sample.columns)}")
+    st.markdown("---")
+
+    st.subheader("First 5 Rows")
+    st.dataframe(preview["head"])
+
+    st.subheader("Column Data Types")
+    st.dataframe(pd.DataFrame(sample.dtypes.astype(str), columns=['Data Type']))
+
+    st.header("2. Descriptive Statistics (approximate)")
+    st.markdown(
+        f"Sample estimates for all numerical columns, with {int(CONFIDENCE * 100)}% confidence "
+        "intervals on each mean:"
+    )
+    st.dataframe(approximate_describe(sample, total_rows))
+
+    st.header("3. Interactive Data Visualizer (approximate)")
+    numerical_cols = sample.select_dtypes(include=['number']).columns.tolist()
+    if numerical_cols:
+        selected_column = st.selectbox(
+            "Select a column to visualize:",
+            numerical_cols,
+            key="progressive_column"
+        )
+        st.subheader(f"Visualization: {selected_column} (sample)")
+        st.bar_chart(sample[selected_column])
+    else:
+        st.info("No numerical columns found for plotting.")
+
+
+@st.fragment(run_every=POLL_INTERVAL_S)
+def _poll_exact(uploaded_file):
+    """Shows refinement progress and reruns the page once the exact analysis is done."""
+    if exact_ready(uploaded_file):
+        st.rerun()
+    st.caption("⏳ Computing exact results in the background...")
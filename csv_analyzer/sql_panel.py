@@ -0,0 +1,168 @@
+# SQL Query Panel for the CSV Data Analyzer.
+# Loads the parsed upload into an in-process SQLite database once per file,
+# lets the user index the columns they filter on, and pages through results
+# so only one page of rows is ever sent to the browser.
+
+import math
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List
+
+import pandas as pd
+import streamlit as st
+
+from profiling import profiled_cache
+
+# --- Configuration ---
+TABLE_NAME = "data"
+LOAD_CHUNK_ROWS = 50_000
+PAGE_SIZES = [50, 100, 500, 1000]
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a column or index name for use inside SQLite statements."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+class SqlWorkspace:
+    """
+    An in-memory SQLite copy of one uploaded file.
+
+    The connection is shared between Streamlit sessions through
+    st.cache_resource, so every statement runs under a lock.
+    """
+
+    def __init__(self, data: pd.DataFrame, table: str = TABLE_NAME):
+        self.table = table
+        self.columns = [str(column) for column in data.columns]
+        self.row_count = len(data)
+        self.indexed_columns = set()
+        self._lock = threading.Lock()
+        self._count_cache: Dict[str, int] = {}
+
+        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        data.to_sql(table, self.conn, index=False, chunksize=LOAD_CHUNK_ROWS)
+        # User queries may only read; index creation flips this off briefly.
+        self.conn.execute("PRAGMA query_only = ON")
+
+    def create_indexes(self, columns: Iterable[str]) -> List[str]:
+        """Create an index for each requested column and return the new ones."""
+        created = []
+        with self._lock:
+            self.conn.execute("PRAGMA query_only = OFF")
+            try:
+                for column in columns:
+                    if column in self.indexed_columns or column not in self.columns:
+                        continue
+                    position = self.columns.index(column)
+                    self.conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS {quote_identifier(f'idx_{self.table}_{position}')} "
+                        f"ON {quote_identifier(self.table)} ({quote_identifier(column)})"
+                    )
+                    self.indexed_columns.add(column)
+                    created.append(column)
+                # Refresh planner statistics only when there is a new index to describe
+                if created:
+                    self.conn.execute("ANALYZE")
+            finally:
+                self.conn.execute("PRAGMA query_only = ON")
+        return created
+
+    def run_query(self, sql: str, page: int = 1, page_size: int = 100) -> Dict[str, Any]:
+        """
+        Run a read-only SELECT and return a single page of its result.
+
+        The total row count is computed once per distinct query; later pages
+        only pay for their own LIMIT/OFFSET window.
+        """
+        statement = sql.strip().rstrip(";").strip()
+        if not statement:
+            raise ValueError("Enter a SQL query to run.")
+        if statement.split(None, 1)[0].upper() not in ("SELECT", "WITH", "VALUES"):
+            raise ValueError("Only SELECT queries are supported in the query panel.")
+
+        page = max(int(page), 1)
+        offset = (page - 1) * page_size
+
+        with self._lock:
+            start = time.perf_counter()
+            if statement not in self._count_cache:
+                self._count_cache[statement] = self.conn.execute(
+                    f"SELECT COUNT(*) FROM ({statement})"
+                ).fetchone()[0]
+            cursor = self.conn.execute(
+                f"SELECT * FROM ({statement}) LIMIT ? OFFSET ?", (page_size, offset)
+            )
+            columns = [description[0] for description in cursor.description]
+            rows = cursor.fetchall()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+        total_rows = self._count_cache[statement]
+        return {
+            "rows": pd.DataFrame(rows, columns=columns),
+            "total_rows": total_rows,
+            "page": page,
+            "page_count": max(math.ceil(total_rows / page_size), 1),
+            "elapsed_ms": elapsed_ms,
+        }
+
+
+@profiled_cache(st.cache_resource, max_entries=4, show_spinner="Loading data into the SQL engine...")
+def get_workspace(cache_key: str, _load_data: Callable[[], pd.DataFrame]) -> SqlWorkspace:
+    """Build (once per uploaded file) the SQLite workspace for the query panel."""
+    return SqlWorkspace(_load_data())
+
+
+def render_query_panel(load_data: Callable[[], pd.DataFrame], cache_key: str):
+    """
+    Draws the SQL Query Panel section of the analyzer.
+
+    load_data is only called the first time a file is queried, so columnar
+    uploads are not materialized in full on every rerun.
+    """
+    st.header("4. SQL Query Panel")
+    st.markdown(
+        f"Filter and aggregate the uploaded data with SQL. The table is named `{TABLE_NAME}`; "
+        "index the columns you filter or group on to speed up large files."
+    )
+
+    workspace = get_workspace(cache_key, load_data)
+
+    index_columns = st.multiselect(
+        "Columns to index:",
+        workspace.columns,
+        key="sql_index_columns"
+    )
+    if index_columns:
+        created = workspace.create_indexes(index_columns)
+        if created:
+            st.toast(f"Indexed: {', '.join(created)}")
+
+    query = st.text_area(
+        "SQL query:",
+        value=f"SELECT * FROM {TABLE_NAME}",
+        height=100,
+        key="sql_query"
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        page_size = st.selectbox("Rows per page:", PAGE_SIZES, index=1, key="sql_page_size")
+    with col2:
+        page = st.number_input("Page:", min_value=1, value=1, step=1, key="sql_page")
+
+    try:
+        result = workspace.run_query(query, page, page_size)
+    except (sqlite3.Error, ValueError) as e:
+        st.error(f"Query failed: {e}")
+        return
+
+    if result["page"] > result["page_count"]:
+        st.warning(f"Page {result['page']} is past the end; the query has {result['page_count']} page(s).")
+
+    st.caption(
+        f"{result['total_rows']:,} matching rows · page {result['page']} of {result['page_count']} · "
+        f"{result['elapsed_ms']:.1f} ms"
+    )
+    st.dataframe(result["rows"], use_container_width=True)
@@ -0,0 +1 @@
+"""Quiz content and the aggregate score store behind the Dark Triad Detector Quiz page (Project 4)."""
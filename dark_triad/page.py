@@ -0,0 +1,14 @@
+# Dark Triad Detector Quiz page (Project 4).
+# Loaded by app.py the first time the page is opened.
+
+import streamlit as st
+
+from dark_triad.quiz import render_quiz
+
+
+def render():
+    """Container for the Dark Triad Detector Quiz project (Project 4)."""
+    st.title("4. 🧠 Dark Triad Detector Quiz")
+
+    # Questions rerun as a fragment; the page around them is drawn once (see dark_triad/quiz.py)
+    render_quiz()
@@ -0,0 +1,69 @@
+# Anonymous aggregate score store for the Dark Triad Detector Quiz.
+# Only one counter per possible score (0-26) is kept, never individual
+# responses. Increments are single UPDATE statements, so concurrent takers in
+# any number of processes sharing the database file cannot lose a count.
+
+import sqlite3
+import threading
+from typing import List, Tuple
+
+import streamlit as st
+
+# --- Configuration ---
+DB_PATH = "quiz_scores.db"
+MAX_SCORE = 26
+BUSY_TIMEOUT_S = 10
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS score_counts (
+    score  INTEGER PRIMARY KEY CHECK (score BETWEEN 0 AND {MAX_SCORE}),
+    takers INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+class ScoreStore:
+    """Counts of completed quizzes per score; counters only ever go up."""
+
+    def __init__(self, path: str = DB_PATH):
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None,
+                                    timeout=BUSY_TIMEOUT_S)
+        self._lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+        # One row per possible score, so recording never has to insert.
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO score_counts (score) VALUES (?)", [(score,) for score in range(MAX_SCORE + 1)]
+        )
+
+    def record(self, score: int):
+        """Count one completed quiz. Raises ValueError for a score outside 0-26."""
+        if not 0 <= score <= MAX_SCORE:
+            raise ValueError(f"Score must be between 0 and {MAX_SCORE}, got {score}.")
+        with self._lock:
+            self.conn.execute("UPDATE score_counts SET takers = takers + 1 WHERE score = ?", (score,))
+
+    def counts(self) -> List[int]:
+        """Takers per score, indexed by score."""
+        with self._lock:
+            return [row[0] for row in self.conn.execute("SELECT takers FROM score_counts ORDER BY score")]
+
+    def percentile(self, score: int) -> Tuple[float, int]:
+        """
+        (percent of takers who scored strictly lower, total takers).
+
+        Reads the 27 counters in one query, so the cost does not grow with
+        the number of people who have taken the quiz.
+        """
+        with self._lock:
+            below, total = self.conn.execute(
+                "SELECT COALESCE(SUM(CASE WHEN score < ? THEN takers END), 0), SUM(takers) FROM score_counts",
+                (score,)
+            ).fetchone()
+        return (100.0 * below / total if total else 0.0), total
+
+
+@st.cache_resource
+def get_score_store() -> ScoreStore:
+    """The process-wide score store, opened once and shared by every session."""
+    return ScoreStore()
@@ -0,0 +1 @@
+"""Storage and analytics behind the Where's My Money? tracker (Project 5)."""
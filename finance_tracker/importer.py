@@ -0,0 +1,200 @@
+# Bulk bank-statement import for the Where's My Money? tracker.
+# CSV and OFX/QFX exports are parsed column-wise with pandas, every row gets a
+# content hash for deduplication, and categories are assigned by one compiled
+# regex built from all of the user's merchant patterns.
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# --- Configuration ---
+IMPORT_TYPES = ["csv", "ofx", "qfx"]
+DEFAULT_INCOME_CATEGORY = "Other Income"
+DEFAULT_EXPENSE_CATEGORY = "Other Expense"
+
+# Header names seen in common bank exports, matched case-insensitively.
+DATE_HEADERS = ["date", "transaction date", "posted date", "posting date", "trans date"]
+DESCRIPTION_HEADERS = ["description", "payee", "merchant", "name", "details", "memo"]
+AMOUNT_HEADERS = ["amount", "transaction amount"]
+DEBIT_HEADERS = ["debit", "withdrawal", "withdrawals"]
+CREDIT_HEADERS = ["credit", "deposit", "deposits"]
+
+
+def _find_column(columns: Dict[str, str], candidates: List[str]) -> Optional[str]:
+    """First original column name whose lowercase form is one of the candidates."""
+    for candidate in candidates:
+        if candidate in columns:
+            return columns[candidate]
+    return None
+
+
+def _to_amount(values: pd.Series) -> pd.Series:
+    """Parse '$1,234.50', '(12.00)' and '-12' style amounts in one pass."""
+    text = values.astype(str).str.strip()
+    negative = text.str.startswith("(") & text.str.endswith(")")
+    numbers = pd.to_numeric(text.str.replace(r"[^0-9.\-]", "", regex=True), errors="coerce")
+    return numbers.where(~negative, -numbers.abs())
+
+
+def _finish(dates: pd.Series, amounts: pd.Series, descriptions: pd.Series) -> pd.DataFrame:
+    """Normalize parsed columns and drop rows without a usable date or amount."""
+    parsed = pd.DataFrame({
+        'Date': pd.to_datetime(dates, errors="coerce", format="mixed"),
+        'Amount': amounts.round(2),
+        'Description': descriptions.fillna("").astype(str).str.strip(),
+    })
+    parsed = parsed.dropna(subset=['Date', 'Amount'])
+    parsed = parsed[parsed['Amount'] != 0]
+    parsed['Date'] = parsed['Date'].dt.strftime("%Y-%m-%d")
+    return parsed.reset_index(drop=True)
+
+
+def parse_bank_csv(file) -> pd.DataFrame:
+    """
+    Parse a bank CSV export into Date / Amount / Description columns.
+
+    Accepts either a single signed amount column or separate debit and
+    credit columns; debits become negative amounts.
+    """
+    raw = pd.read_csv(file, dtype=str)
+    columns = {str(column).strip().lower(): column for column in raw.columns}
+
+    date_col = _find_column(columns, DATE_HEADERS)
+    description_col = _find_column(columns, DESCRIPTION_HEADERS)
+    amount_col = _find_column(columns, AMOUNT_HEADERS)
+    debit_col = _find_column(columns, DEBIT_HEADERS)
+    credit_col = _find_column(columns, CREDIT_HEADERS)
+
+    if date_col is None or (amount_col is None and debit_col is None and credit_col is None):
+        raise ValueError(
+            "Could not find date and amount columns. Expected headers like "
+            "'Date', 'Description' and 'Amount' (or 'Debit'/'Credit')."
+        )
+
+    if amount_col is not None:
+        amounts = _to_amount(raw[amount_col])
+    else:
+        debits = _to_amount(raw[debit_col]).abs().fillna(0) if debit_col else 0
+        credits = _to_amount(raw[credit_col]).abs().fillna(0) if credit_col else 0
+        amounts = credits - debits
+
+    descriptions = raw[description_col] if description_col else pd.Series("", index=raw.index)
+    return _finish(raw[date_col], amounts, descriptions)
+
+
+def parse_ofx(file) -> pd.DataFrame:
+    """
+    Parse an OFX/QFX statement (SGML or XML flavour).
+
+    Each <STMTTRN> block becomes one row; the fields are pulled out of all
+    blocks at once with vectorized regex extraction.
+    """
+    text = file.read()
+    if isinstance(text, bytes):
+        text = text.decode("utf-8", errors="replace")
+    blocks = pd.Series(re.findall(r"<STMTTRN>(.*?)</STMTTRN>", text, flags=re.S | re.I), dtype=str)
+    if blocks.empty:
+        raise ValueError("No <STMTTRN> transactions found in the OFX file.")
+
+    def field(tag: str) -> pd.Series:
+        return blocks.str.extract(rf"<{tag}>\s*([^<\r\n]*)", flags=re.I)[0].str.strip()
+
+    names = field("NAME").fillna("")
+    memos = field("MEMO").fillna("")
+    descriptions = names.where(names != "", memos)
+    return _finish(field("DTPOSTED").str[:8], _to_amount(field("TRNAMT")), descriptions)
+
+
+def parse_statement(uploaded_file) -> pd.DataFrame:
+    """Dispatch on the uploaded file's extension."""
+    if uploaded_file.name.lower().endswith((".ofx", ".qfx")):
+        return parse_ofx(uploaded_file)
+    return parse_bank_csv(uploaded_file)
+
+
+def content_hashes(transactions: pd.DataFrame) -> pd.Series:
+    """
+    64-bit content hash of (date, amount, description, occurrence) per row.
+
+    The occurrence number keeps genuinely repeated rows in one statement
+    (two identical coffees on the same day) while still matching the same
+    rows when the statement is imported again.
+    """
+    keys = transactions[['Date', 'Amount', 'Description']].copy()
+    keys['Amount'] = keys['Amount'].round(2)
+    keys['Occurrence'] = keys.groupby(['Date', 'Amount', 'Description']).cumcount()
+    hashed = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    return pd.Series(hashed.view(np.int64), index=transactions.index)
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """
+    Build one regex from many literals by factoring their common prefixes.
+
+    'amazon', 'amex', 'apple' becomes 'a(?:m(?:azon|ex)|pple)', so the regex
+    engine follows a single branch per character like a trie automaton
+    instead of retrying every alternative at every position.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        terminal = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if terminal else group
+
+    return build(trie)
+
+
+class CategoryRules:
+    """
+    Merchant-pattern to category rules compiled into a single regex.
+
+    Patterns are case-insensitive literal substrings of the description; the
+    longest pattern wins when several match at the same position.
+    """
+
+    def __init__(self, rules: Iterable[Tuple[str, str]]):
+        self.lookup = {}
+        for pattern, category in rules:
+            pattern = str(pattern or "").strip().lower()
+            if pattern and category:
+                self.lookup[pattern] = str(category)
+        self.regex = (
+            re.compile("(" + _trie_regex(self.lookup) + ")", re.IGNORECASE) if self.lookup else None
+        )
+
+    def categorize(self, descriptions: pd.Series, amounts: pd.Series) -> pd.Series:
+        """Category per row; unmatched rows fall back to Other Income / Other Expense."""
+        fallback = pd.Series(
+            np.where(amounts > 0, DEFAULT_INCOME_CATEGORY, DEFAULT_EXPENSE_CATEGORY),
+            index=descriptions.index
+        )
+        if self.regex is None:
+            return fallback
+        # Bank descriptions repeat heavily, so match each distinct one only once.
+        unique = pd.Series(descriptions.unique())
+        matched = unique.str.extract(self.regex)[0].str.lower().map(self.lookup)
+        categories = descriptions.map(dict(zip(unique, matched)))
+        return categories.fillna(fallback)
+
+
+def prepare_import(parsed: pd.DataFrame, rules: CategoryRules) -> pd.DataFrame:
+    """Turn parsed statement rows into ledger rows with type, category and hash."""
+    prepared = parsed.copy()
+    prepared['Type'] = np.where(prepared['Amount'] > 0, "Income", "Expense")
+    prepared['Category'] = rules.categorize(prepared['Description'], prepared['Amount'])
+    prepared['Hash'] = content_hashes(prepared)
+    return prepared
+
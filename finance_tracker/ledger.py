@@ -0,0 +1,320 @@
+# Append-only transaction ledger for the Where's My Money? tracker.
+# Transactions persist in SQLite (indexed on owner and date), and the summary
+# metrics are kept as running aggregates updated in the same transaction as
+# each insert, so reading them never rescans the history. Daily and monthly
+# per-category rollups are maintained the same way and drive the trend views.
+# Every table is keyed by owner, the browser session's resume token, so
+# visitors sharing the server process only ever see their own ledger.
+# PORTFOLIO_LEDGER_DB sets the database file (a path or sqlite:///path).
+# Replicas see the same ledgers only when they open the same file, e.g. on a
+# volume shared by replicas on one host; the session store does not hold it.
+
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+# --- Configuration ---
+LEDGER_ENV = "PORTFOLIO_LEDGER_DB"
+DB_PATH = "finance_ledger.db"
+COLUMNS = ['Date', 'Type', 'Amount', 'Category', 'Description']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id          INTEGER PRIMARY KEY,
+    date        TEXT NOT NULL,            -- ISO YYYY-MM-DD, so text order is date order
+    type        TEXT NOT NULL,            -- 'Income' or 'Expense'
+    amount      REAL NOT NULL,            -- signed: expenses are negative
+    category    TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    content_hash INTEGER,                 -- set for imported rows; NULL for manual entries
+    owner       TEXT NOT NULL             -- the session that recorded the row (see session_owner)
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_owner_date ON transactions (owner, date);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_transactions_owner_hash ON transactions (owner, content_hash);
+
+CREATE TABLE IF NOT EXISTS type_totals (
+    owner TEXT NOT NULL,
+    type  TEXT NOT NULL,
+    total REAL NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (owner, type)
+);
+
+CREATE TABLE IF NOT EXISTS category_totals (
+    owner    TEXT NOT NULL,
+    type     TEXT NOT NULL,
+    category TEXT NOT NULL,
+    total    REAL NOT NULL,
+    count    INTEGER NOT NULL,
+    PRIMARY KEY (owner, type, category)
+);
+
+-- Materialized rollups: one row per (owner, period, type, category) bucket.
+CREATE TABLE IF NOT EXISTS daily_rollup (
+    owner    TEXT NOT NULL,
+    day      TEXT NOT NULL,               -- YYYY-MM-DD
+    type     TEXT NOT NULL,
+    category TEXT NOT NULL,
+    total    REAL NOT NULL,
+    count    INTEGER NOT NULL,
+    PRIMARY KEY (owner, day, type, category)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS monthly_rollup (
+    owner    TEXT NOT NULL,
+    month    TEXT NOT NULL,               -- YYYY-MM
+    type     TEXT NOT NULL,
+    category TEXT NOT NULL,
+    total    REAL NOT NULL,
+    count    INTEGER NOT NULL,
+    PRIMARY KEY (owner, month, type, category)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS category_rules (
+    owner    TEXT NOT NULL,
+    pattern  TEXT NOT NULL COLLATE NOCASE,
+    category TEXT NOT NULL,
+    PRIMARY KEY (owner, pattern)
+);
+
+CREATE TEMP TABLE IF NOT EXISTS staging (
+    owner TEXT, date TEXT, type TEXT, amount REAL, category TEXT, description TEXT, content_hash INTEGER
+);
+"""
+
+
+class Ledger:
+    """
+    Append-only store of transactions with incrementally maintained totals.
+
+    One connection is shared by every session (see get_ledger), so writes
+    and reads are serialized with a lock. Every row, total and rule belongs
+    to an owner, and every method reads and writes one owner's data only.
+    """
+
+    def __init__(self, path: str = DB_PATH):
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _transaction(self):
+        """Run a block of statements atomically under the ledger lock."""
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def add(self, owner: str, date: str, type_: str, amount: float, category: str,
+            description: str = "") -> int:
+        """Record a single transaction; amount is signed (expenses negative)."""
+        return self._insert(owner, [(date, type_, amount, category, description, None)])
+
+    def add_many(self, owner: str, transactions: pd.DataFrame) -> int:
+        """
+        Append a batch of transactions and fold them into the running totals.
+
+        Rows carrying a 'Hash' that is already in the owner's ledger (or
+        earlier in the batch) are skipped. Returns the number of rows
+        actually added.
+        """
+        if transactions.empty:
+            return 0
+        batch = transactions[COLUMNS].copy()
+        batch['Description'] = batch['Description'].fillna("")
+        batch['Hash'] = transactions['Hash'] if 'Hash' in transactions else None
+        batch = batch[~(batch['Hash'].notna() & batch['Hash'].duplicated())]
+        batch['Hash'] = batch['Hash'].astype(object).where(batch['Hash'].notna(), None)
+        return self._insert(owner, batch.itertuples(index=False, name=None))
+
+    def _insert(self, owner: str, rows) -> int:
+        """
+        Stage rows, drop already-imported hashes, then append and aggregate.
+
+        The totals are updated with one GROUP BY over the staged rows, so a
+        batch costs one upsert per (type, category) rather than per row.
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM staging")
+            conn.executemany("INSERT INTO staging VALUES (?, ?, ?, ?, ?, ?, ?)",
+                             ((owner,) + tuple(row) for row in rows))
+            conn.execute(
+                """DELETE FROM staging WHERE content_hash IS NOT NULL AND EXISTS (
+                       SELECT 1 FROM transactions t
+                       WHERE t.owner = staging.owner AND t.content_hash = staging.content_hash)"""
+            )
+            inserted = conn.execute("SELECT COUNT(*) FROM staging").fetchone()[0]
+            conn.execute(
+                """INSERT INTO transactions (owner, date, type, amount, category, description, content_hash)
+                   SELECT owner, date, type, amount, category, description, content_hash FROM staging"""
+            )
+            self._aggregate(conn, "staging")
+        return inserted
+
+    @staticmethod
+    def _aggregate(conn: sqlite3.Connection, source: str):
+        """Add the rows of `source` into the totals and the daily and monthly rollup buckets."""
+        conn.execute(
+            f"""INSERT INTO category_totals (owner, type, category, total, count)
+                SELECT owner, type, category, SUM(amount), COUNT(*) FROM {source} WHERE true
+                GROUP BY owner, type, category
+                ON CONFLICT (owner, type, category) DO UPDATE
+                SET total = total + excluded.total, count = count + excluded.count"""
+        )
+        conn.execute(
+            f"""INSERT INTO type_totals (owner, type, total, count)
+                SELECT owner, type, SUM(amount), COUNT(*) FROM {source} WHERE true
+                GROUP BY owner, type
+                ON CONFLICT (owner, type) DO UPDATE
+                SET total = total + excluded.total, count = count + excluded.count"""
+        )
+        for table, period, bucket in (("daily_rollup", "day", "date"),
+                                      ("monthly_rollup", "month", "substr(date, 1, 7)")):
+            conn.execute(
+                f"""INSERT INTO {table} (owner, {period}, type, category, total, count)
+                    SELECT owner, {bucket}, type, category, SUM(amount), COUNT(*) FROM {source} WHERE true
+                    GROUP BY owner, 2, type, category
+                    ON CONFLICT (owner, {period}, type, category) DO UPDATE
+                    SET total = total + excluded.total, count = count + excluded.count"""
+            )
+
+    def rules(self, owner: str) -> pd.DataFrame:
+        """The owner's saved merchant-pattern categorization rules."""
+        with self._lock:
+            return pd.read_sql_query(
+                "SELECT pattern, category FROM category_rules WHERE owner = ? ORDER BY pattern",
+                self.conn, params=(owner,)
+            )
+
+    def save_rules(self, owner: str, rules: pd.DataFrame):
+        """Replace the owner's categorization rules with the edited set."""
+        cleaned = rules[['pattern', 'category']].dropna()
+        cleaned = cleaned[(cleaned['pattern'].str.strip() != "") & (cleaned['category'].str.strip() != "")]
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM category_rules WHERE owner = ?", (owner,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO category_rules (owner, pattern, category) VALUES (?, ?, ?)",
+                ((owner, pattern, category) for pattern, category in cleaned.itertuples(index=False, name=None))
+            )
+
+    def totals(self, owner: str) -> Dict[str, float]:
+        """All-time income, expense (negative), net balance and transaction count."""
+        with self._lock:
+            rows = dict(
+                (type_, (total, count))
+                for type_, total, count in self.conn.execute(
+                    "SELECT type, total, count FROM type_totals WHERE owner = ?", (owner,)
+                )
+            )
+        income, income_count = rows.get("Income", (0.0, 0))
+        expense, expense_count = rows.get("Expense", (0.0, 0))
+        return {
+            "income": income,
+            "expense": expense,
+            "net": income + expense,
+            "count": income_count + expense_count,
+        }
+
+    def category_totals(self, owner: str, type_: str = "Expense") -> pd.Series:
+        """Per-category totals for one transaction type, largest magnitude first."""
+        with self._lock:
+            summary = pd.read_sql_query(
+                """SELECT category AS Category, total AS Amount FROM category_totals
+                   WHERE owner = ? AND type = ?""",
+                self.conn, params=(owner, type_)
+            )
+        return summary.set_index('Category')['Amount'].abs().sort_values(ascending=False)
+
+    def date_bounds(self, owner: str) -> Optional[Tuple[str, str]]:
+        """First and last transaction day, read from the ends of the owner's rollup key range."""
+        with self._lock:
+            first, last = self.conn.execute(
+                "SELECT MIN(day), MAX(day) FROM daily_rollup WHERE owner = ?", (owner,)
+            ).fetchone()
+        return (first, last) if first else None
+
+    def rollup(self, owner: str, start: str, end: str, granularity: str = "day") -> pd.DataFrame:
+        """
+        Per-period, per-category totals between two ISO dates (inclusive).
+
+        Reads only the rollup buckets in range, so cost follows the number of
+        periods and categories, not the number of transactions.
+        """
+        table, period, low, high = self._rollup_range(start, end, granularity)
+        with self._lock:
+            return pd.read_sql_query(
+                f"""SELECT {period} AS Period, type AS Type, category AS Category,
+                           total AS Amount, count AS Transactions
+                    FROM {table} WHERE owner = ? AND {period} BETWEEN ? AND ? ORDER BY {period}""",
+                self.conn, params=(owner, low, high)
+            )
+
+    def balance_series(self, owner: str, start: str, end: str, granularity: str = "day") -> pd.DataFrame:
+        """
+        Net flow and cumulative running balance per period between two dates.
+
+        The opening balance is the sum of all buckets before the range, so the
+        running balance matches the all-time net at the latest period.
+        """
+        table, period, low, high = self._rollup_range(start, end, granularity)
+        with self._lock:
+            opening = self.conn.execute(
+                f"SELECT COALESCE(SUM(total), 0) FROM {table} WHERE owner = ? AND {period} < ?", (owner, low)
+            ).fetchone()[0]
+            series = pd.read_sql_query(
+                f"""SELECT {period} AS Period, SUM(total) AS Net FROM {table}
+                    WHERE owner = ? AND {period} BETWEEN ? AND ? GROUP BY {period} ORDER BY {period}""",
+                self.conn, params=(owner, low, high)
+            )
+        series['Balance'] = opening + series['Net'].cumsum()
+        return series
+
+    @staticmethod
+    def _rollup_range(start: str, end: str, granularity: str) -> Tuple[str, str, str, str]:
+        """Table, key column and key bounds for a date range at a granularity."""
+        if granularity == "month":
+            return "monthly_rollup", "month", start[:7], end[:7]
+        return "daily_rollup", "day", start, end
+
+    def history(self, owner: str, limit: int = 100, offset: int = 0) -> pd.DataFrame:
+        """The owner's most recent transactions first, read straight off the (owner, date) index."""
+        with self._lock:
+            return pd.read_sql_query(
+                """SELECT date AS Date, type AS Type, amount AS Amount,
+                          category AS Category, description AS Description
+                   FROM transactions WHERE owner = ? ORDER BY date DESC, id DESC LIMIT ? OFFSET ?""",
+                self.conn, params=(owner, limit, offset)
+            )
+
+
+def ledger_path(url: str) -> str:
+    """Database file for a PORTFOLIO_LEDGER_DB value: empty, a path, or sqlite:///path."""
+    url = url.strip()
+    if url.startswith("sqlite:///"):
+        url = url[len("sqlite:///"):]
+    return url or DB_PATH
+
+
+@st.cache_resource
+def get_ledger() -> Ledger:
+    """The process-wide ledger, opened once and shared by every session (each reads only its own rows)."""
+    from session_store import BACKEND_ENV
+
+    if os.environ.get(BACKEND_ENV, "").startswith("redis://") and not os.environ.get(LEDGER_ENV):
+        logger.warning("Sessions are shared through Redis but %s is unset: ledgers stay on this host, "
+                       "so a session resumed on another replica sees an empty ledger.", LEDGER_ENV)
+    return Ledger(ledger_path(os.environ.get(LEDGER_ENV, "")))
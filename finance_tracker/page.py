@@ -0,0 +1,180 @@
+# Where's My Money? page (Project 5).
+# Loaded by app.py the first time the page is opened.
+
+import datetime
+import time
+from datetime import timedelta
+
+import plotly.express as px
+import streamlit as st
+
+from finance_tracker.importer import IMPORT_TYPES, CategoryRules, parse_statement, prepare_import
+from finance_tracker.ledger import get_ledger
+from profiling import section
+from session_store import session_owner
+
+# --- Configuration ---
+# Number of recent transactions shown in the history table
+HISTORY_ROWS = 200
+
+
+def render():
+    """Container for the Where's My Money? Tracker project (Project 5)."""
+    
+    # --- Start of FIXED Finance Tracker Code ---
+    
+    # Transactions live in the persistent SQLite ledger shared by all sessions;
+    # each session reads and writes only the rows keyed by its resume token
+    ledger = get_ledger()
+    owner = session_owner()
+        
+    st.title("5. 💰 Where's My Money? (Transaction Tracker)")
+    st.markdown("A simple tool to track income and expenses and view your running balance.")
+
+    # --- 1. Add New Transaction Section ---
+    st.header("1. Add New Transaction")
+    
+    # FIX 1: Radio button moved outside the form to update categories immediately
+    transaction_type = st.radio("Type", ["Income", "Expense"], horizontal=True, key="transaction_type_radio")
+
+    # Define categories based on the user's selection above
+    if transaction_type == "Income":
+        categories = ["Salary", "Investment", "Gift", "Other Income"]
+    else:
+        categories = ["Groceries", "Rent", "Utilities", "Transport", "Entertainment", "Other Expense"]
+
+    
+    with st.form("transaction_form", clear_on_submit=True):
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            # FIX 2: Compensate for UTC skew by subtracting 1 day (using datetime.timedelta)
+            server_date_skew = datetime.date.today()
+            corrected_date = server_date_skew - timedelta(days=1)
+            date = st.date_input("Date", corrected_date)
+        
+        with col2:
+            amount = st.number_input("Amount", min_value=0.01, format="%.2f")
+            category = st.selectbox("Category", categories)
+            
+        with col3:
+            description = st.text_input("Description (Optional)")
+
+        submitted = st.form_submit_button("Record Transaction")
+
+        if submitted:
+            final_amount = amount if transaction_type == "Income" else -amount
+            
+            # Appends one row and bumps the running totals in a single transaction
+            ledger.add(
+                owner,
+                date.strftime("%Y-%m-%d"),
+                transaction_type,
+                final_amount,
+                category,
+                description
+            )
+            st.success("Transaction recorded successfully!")
+
+    # --- 2. Bulk Import Section ---
+    st.header("2. Import Bank Statement")
+    st.markdown("Upload a CSV or OFX/QFX export from your bank. Rows already in the ledger are skipped.")
+
+    with st.expander("Categorization Rules (merchant pattern → category)"):
+        edited_rules = st.data_editor(
+            ledger.rules(owner),
+            num_rows="dynamic",
+            use_container_width=True,
+            key="category_rules_editor"
+        )
+        if st.button("Save Rules"):
+            ledger.save_rules(owner, edited_rules)
+            st.success("Rules saved.")
+
+    statement = st.file_uploader("Bank export:", type=IMPORT_TYPES, key="statement_uploader")
+    if statement is not None and st.button("Import Transactions", type="primary"):
+        start = time.perf_counter()
+        try:
+            parsed = parse_statement(statement)
+        except Exception as e:
+            st.error(f"Could not read the statement: {e}")
+        else:
+            # One compiled rules regex categorizes the whole batch at once
+            rules = CategoryRules(ledger.rules(owner).itertuples(index=False, name=None))
+            prepared = prepare_import(parsed, rules)
+            added = ledger.add_many(owner, prepared)
+            elapsed = time.perf_counter() - start
+            st.success(
+                f"Imported {added:,} new transactions "
+                f"({len(prepared) - added:,} duplicates skipped) in {elapsed:.2f} s."
+            )
+
+    # --- 3. Summary and Dashboard Section ---
+    st.header("3. Financial Summary")
+
+    # Metrics come from the incrementally maintained aggregates, not a rescan
+    with section("ledger totals"):
+        totals = ledger.totals(owner)
+
+    if totals["count"] > 0:
+        total_income = totals["income"]
+        total_expense = totals["expense"]
+        net_balance = totals["net"]
+        
+        col_m1, col_m2, col_m3 = st.columns(3)
+        
+        col_m1.metric("Total Income", f"${total_income:,.2f}", "Up")
+        col_m2.metric("Total Expenses", f"${abs(total_expense):,.2f}", "Down")
+        col_m3.metric("Net Balance", f"${net_balance:,.2f}", 
+                      "Positive" if net_balance >= 0 else "Negative")
+
+        st.subheader("Transaction History")
+        with section("history query"):
+            history = ledger.history(owner, limit=HISTORY_ROWS)
+        st.caption(f"Showing the {len(history):,} most recent of {totals['count']:,} transactions.")
+        st.dataframe(history, use_container_width=True)
+
+        st.subheader("Expenses by Category")
+        with section("category totals"):
+            category_summary = ledger.category_totals(owner, "Expense")
+        if not category_summary.empty:
+            st.bar_chart(category_summary)
+        else:
+            st.info("No expenses recorded yet to show category breakdown.")
+
+        # --- 4. Trends Section (reads the daily/monthly rollups, not the transactions) ---
+        st.header("4. Trends")
+        first_day, last_day = ledger.date_bounds(owner)
+        col_t1, col_t2 = st.columns([2, 1])
+        with col_t1:
+            date_range = st.date_input(
+                "Date range",
+                (datetime.date.fromisoformat(first_day), datetime.date.fromisoformat(last_day)),
+                key="trend_date_range"
+            )
+        with col_t2:
+            granularity = st.radio("Granularity", ["Daily", "Monthly"], horizontal=True, key="trend_granularity")
+
+        if len(date_range) == 2:
+            start, end = (day.strftime("%Y-%m-%d") for day in date_range)
+            period = "day" if granularity == "Daily" else "month"
+
+            with section("balance series"):
+                balance = ledger.balance_series(owner, start, end, period)
+            if not balance.empty:
+                st.subheader("Running Balance")
+                with section("balance figure"):
+                    st.plotly_chart(px.line(balance, x="Period", y="Balance", markers=len(balance) < 60))
+
+                with section("category rollup"):
+                    flows = ledger.rollup(owner, start, end, period)
+                    expenses = flows[flows["Type"] == "Expense"].assign(Amount=lambda df: df["Amount"].abs())
+                if not expenses.empty:
+                    st.subheader("Expenses by Category over Time")
+                    with section("category figure"):
+                        st.plotly_chart(px.bar(expenses, x="Period", y="Amount", color="Category"))
+            else:
+                st.info("No transactions in the selected range.")
+            
+    else:
+        st.info("No transactions recorded yet. Add one above!")
@@ -0,0 +1 @@
+"""Storage and scoring behind the LeaseSync AI page (Project 6)."""
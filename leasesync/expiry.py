@@ -0,0 +1,253 @@
+# Expiry queues and the daily renewal job for LeaseSync AI.
+# Once per local date a background job rescores only the leases whose
+# inputs changed since the previous run, then stores the upcoming-expiry and
+# renewal-offer queues so the dashboard reads precomputed rows. The scoring
+# tiers live in the database too, so the job and the Renewal Predictions tab
+# always score with the same settings.
+
+import datetime
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from leasesync.repository import LEASE_COLUMNS, LeaseRepository
+from leasesync.scoring import DEFAULT_CHANCE, DEFAULT_TIERS, OFFER_THRESHOLD, score_renewals
+
+logger = logging.getLogger(__name__)
+
+# --- Configuration ---
+EXPIRY_WINDOWS = [30, 60, 90]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lease_scores (
+    tenant_id      INTEGER PRIMARY KEY,
+    renewal_chance INTEGER NOT NULL,
+    scored_on      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_lease_scores_chance ON lease_scores (renewal_chance);
+
+CREATE TABLE IF NOT EXISTS job_runs (
+    run_date    TEXT PRIMARY KEY,         -- local date the queues were built for
+    finished_at TEXT NOT NULL,            -- UTC, same clock as leases.updated_at
+    tiers       TEXT NOT NULL,            -- JSON of the tiers and default chance used, to detect changes
+    rescored    INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS scoring_config (
+    id             INTEGER PRIMARY KEY CHECK (id = 1),  -- a single row for the portfolio
+    tiers          TEXT NOT NULL,                       -- JSON [[within_days, renewal_chance], ...]
+    default_chance INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS expiry_queue (
+    window_days INTEGER NOT NULL,
+    tenant_id   INTEGER NOT NULL,
+    name        TEXT NOT NULL,
+    lease_end   TEXT NOT NULL,
+    rent        REAL NOT NULL,
+    status      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_expiry_queue_window ON expiry_queue (window_days, lease_end);
+
+CREATE TABLE IF NOT EXISTS renewal_queue (
+    tenant_id      INTEGER NOT NULL,
+    name           TEXT NOT NULL,
+    lease_end      TEXT NOT NULL,
+    renewal_chance INTEGER NOT NULL
+);
+"""
+
+
+def _plus_days(day: datetime.date, days: int) -> str:
+    return (day + datetime.timedelta(days=days)).isoformat()
+
+
+def _scoring_fingerprint(tiers: Sequence[Tuple[int, int]], default_chance: int) -> str:
+    """JSON of every scoring parameter, stored with each run so a change forces a full rescore."""
+    return json.dumps({"tiers": sorted(tiers), "default_chance": default_chance})
+
+
+def _parse_scoring(row: Optional[Tuple[str, int]]) -> Tuple[List[Tuple[int, int]], int]:
+    if row is None:
+        return list(DEFAULT_TIERS), DEFAULT_CHANCE
+    return [tuple(tier) for tier in json.loads(row[0])], int(row[1])
+
+
+def scoring_settings(repo: LeaseRepository) -> Tuple[List[Tuple[int, int]], int]:
+    """The saved (tiers, default_chance) that the renewal job scores with; the defaults until saved."""
+    saved = repo.read_sql("SELECT tiers, default_chance FROM scoring_config WHERE id = 1")
+    return _parse_scoring(None if saved.empty else tuple(saved.iloc[0]))
+
+
+def save_scoring_settings(repo: LeaseRepository, tiers: Sequence[Tuple[int, int]], default_chance: int):
+    """Store the tiers and default chance used by every later run of the renewal job."""
+    with repo.transaction() as conn:
+        conn.execute(
+            """INSERT INTO scoring_config (id, tiers, default_chance) VALUES (1, ?, ?)
+               ON CONFLICT (id) DO UPDATE
+               SET tiers = excluded.tiers, default_chance = excluded.default_chance""",
+            (json.dumps(sorted(tuple(int(value) for value in tier) for tier in tiers)), int(default_chance))
+        )
+
+
+def _stale_leases(conn, today: datetime.date, last_run: Optional[Tuple[str, str, str]],
+                  tiers: Sequence[Tuple[int, int]], default_chance: int) -> Optional[pd.DataFrame]:
+    """
+    Leases whose score may differ from the stored one; None means rescore everything.
+
+    A score changes only when the lease row was edited, or when its
+    days-to-end crossed a tier boundary b since the last run, i.e.
+    last_run + b <= lease_end < today + b. Both are indexed range scans.
+    """
+    if last_run is None or last_run[2] != _scoring_fingerprint(tiers, default_chance):
+        return None
+    last_date = datetime.date.fromisoformat(last_run[0])
+    columns = ", ".join(LEASE_COLUMNS)
+    queries = [(f"SELECT {columns} FROM leases WHERE updated_at >= ?", (last_run[1],))]
+    for within_days, _ in tiers:
+        queries.append((
+            f"SELECT {columns} FROM leases WHERE lease_end >= ? AND lease_end < ?",
+            (_plus_days(last_date, within_days), _plus_days(today, within_days))
+        ))
+    frames = [pd.read_sql_query(sql, conn, params=params) for sql, params in queries]
+    return pd.concat(frames, ignore_index=True).drop_duplicates("tenant_id")
+
+
+def run_renewal_job(repo: LeaseRepository, today: Optional[datetime.date] = None,
+                    tiers: Optional[Sequence[Tuple[int, int]]] = None,
+                    default_chance: Optional[int] = None, force: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Rescore changed leases and rebuild today's expiry and renewal-offer queues.
+
+    Scores with the saved scoring settings (see save_scoring_settings)
+    unless tiers or default_chance are given. Runs inside one IMMEDIATE
+    transaction, so replicas sharing the database cannot run it
+    concurrently; returns None if today's run already exists and force is
+    False.
+    """
+    today = today or datetime.date.today()
+    started = time.perf_counter()
+
+    with repo.transaction() as conn:
+        saved_tiers, saved_chance = _parse_scoring(
+            conn.execute("SELECT tiers, default_chance FROM scoring_config WHERE id = 1").fetchone()
+        )
+        tiers = [tuple(tier) for tier in (saved_tiers if tiers is None else tiers)]
+        default_chance = saved_chance if default_chance is None else default_chance
+        last_run = conn.execute(
+            "SELECT run_date, finished_at, tiers FROM job_runs ORDER BY run_date DESC LIMIT 1"
+        ).fetchone()
+        if last_run and last_run[0] == today.isoformat() and not force:
+            return None
+
+        stale = _stale_leases(conn, today, last_run, tiers, default_chance)
+        if stale is None:
+            stale = pd.read_sql_query(f"SELECT {', '.join(LEASE_COLUMNS)} FROM leases", conn)
+        if not stale.empty:
+            scored = score_renewals(stale, now=datetime.datetime.combine(today, datetime.time()),
+                                    tiers=tiers, default_chance=default_chance)
+            conn.executemany(
+                """INSERT INTO lease_scores (tenant_id, renewal_chance, scored_on) VALUES (?, ?, ?)
+                   ON CONFLICT (tenant_id) DO UPDATE
+                   SET renewal_chance = excluded.renewal_chance, scored_on = excluded.scored_on""",
+                zip(scored["tenant_id"].tolist(), scored["renewal_chance"].tolist(),
+                    [today.isoformat()] * len(scored))
+            )
+
+        # Upcoming expirations: one range scan on the lease_end index.
+        upcoming = pd.read_sql_query(
+            f"""SELECT {', '.join(LEASE_COLUMNS)} FROM leases
+                WHERE lease_end BETWEEN ? AND ? ORDER BY lease_end""",
+            conn, params=(today.isoformat(), _plus_days(today, max(EXPIRY_WINDOWS)))
+        )
+        days = (pd.to_datetime(upcoming["lease_end"]) - pd.Timestamp(today)).dt.days.to_numpy()
+        upcoming.insert(0, "window_days", np.array(EXPIRY_WINDOWS)[np.searchsorted(EXPIRY_WINDOWS, days)])
+        conn.execute("DELETE FROM expiry_queue")
+        conn.executemany(
+            "INSERT INTO expiry_queue VALUES (?, ?, ?, ?, ?, ?)",
+            upcoming.itertuples(index=False, name=None)
+        )
+
+        conn.execute("DELETE FROM renewal_queue")
+        conn.execute(
+            """INSERT INTO renewal_queue
+               SELECT l.tenant_id, l.name, l.lease_end, s.renewal_chance
+               FROM lease_scores s JOIN leases l ON l.tenant_id = s.tenant_id
+               WHERE s.renewal_chance > ? ORDER BY l.lease_end""",
+            (OFFER_THRESHOLD,)
+        )
+
+        conn.execute(
+            """INSERT OR REPLACE INTO job_runs (run_date, finished_at, tiers, rescored)
+               VALUES (?, datetime('now'), ?, ?)""",
+            (today.isoformat(), _scoring_fingerprint(tiers, default_chance), len(stale))
+        )
+
+    summary = {
+        "run_date": today.isoformat(),
+        "rescored": len(stale),
+        "upcoming": len(upcoming),
+        "elapsed_s": time.perf_counter() - started,
+    }
+    logger.info("LeaseSync renewal job: %s", summary)
+    return summary
+
+
+def ensure_schema(repo: LeaseRepository):
+    """Create the job's tables next to the leases table."""
+    with repo.transaction() as conn:
+        for statement in SCHEMA.split(";"):
+            if statement.strip():
+                conn.execute(statement)
+
+
+def last_run(repo: LeaseRepository) -> Optional[Dict[str, Any]]:
+    """The most recent job run, or None before the first one."""
+    runs = repo.read_sql("SELECT * FROM job_runs ORDER BY run_date DESC LIMIT 1")
+    return None if runs.empty else runs.iloc[0].to_dict()
+
+
+def expiry_queue(repo: LeaseRepository, within_days: int) -> pd.DataFrame:
+    """Precomputed leases expiring within a window, soonest first."""
+    return repo.read_sql(
+        """SELECT tenant_id, name, lease_end, rent, status FROM expiry_queue
+           WHERE window_days <= ? ORDER BY lease_end""",
+        (within_days,)
+    )
+
+
+def renewal_queue(repo: LeaseRepository) -> pd.DataFrame:
+    """Precomputed renewal-offer queue, soonest expiry first."""
+    return repo.read_sql("SELECT * FROM renewal_queue ORDER BY lease_end")
+
+
+def _seconds_until_midnight() -> float:
+    now = datetime.datetime.now()
+    tomorrow = datetime.datetime.combine(now.date() + datetime.timedelta(days=1), datetime.time())
+    return (tomorrow - now).total_seconds()
+
+
+def _scheduler_loop(repo: LeaseRepository):
+    """Run the job now if today's run is missing, then again after each midnight."""
+    while True:
+        try:
+            run_renewal_job(repo)
+        except Exception:
+            logger.exception("LeaseSync renewal job failed")
+        # A little past midnight, so date.today() has rolled over.
+        time.sleep(_seconds_until_midnight() + 5)
+
+
+@st.cache_resource
+def start_scheduler(_repo: LeaseRepository) -> threading.Thread:
+    """Start the daily job thread once per process."""
+    ensure_schema(_repo)
+    thread = threading.Thread(target=_scheduler_loop, args=(_repo,), name="leasesync-renewal-job", daemon=True)
+    thread.start()
+    return thread
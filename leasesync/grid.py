@@ -0,0 +1,124 @@
+# Paged rendering helpers for LeaseSync AI.
+# Tables are sent to the browser one page at a time through st.dataframe
+# (a virtualized canvas grid), and renewal actions are grouped into a single
+# paginated list instead of one alert element per tenant.
+
+import math
+from typing import Tuple
+
+import pandas as pd
+import streamlit as st
+
+from leasesync.expiry import EXPIRY_WINDOWS, expiry_queue, last_run, renewal_queue, run_renewal_job
+from leasesync.repository import LEASE_COLUMNS, LeaseRepository
+from leasesync.scoring import OFFER_THRESHOLD
+
+# --- Configuration ---
+PAGE_SIZES = [25, 50, 100, 250]
+PREVIEW_ROWS = 100
+SEND_OFFER = "📨 Send renewal offer"
+FOLLOW_UP = "📞 Follow up"
+
+
+def paginate(frame: pd.DataFrame, page: int, page_size: int) -> pd.DataFrame:
+    """Rows for one 1-based page of an in-memory frame."""
+    start = (max(int(page), 1) - 1) * page_size
+    return frame.iloc[start:start + page_size]
+
+
+def render_pager(key: str, total_rows: int) -> Tuple[int, int]:
+    """Draws page-size and page-number controls; returns (page, page_size)."""
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        page_size = st.selectbox("Rows per page", PAGE_SIZES, index=1, key=f"{key}_page_size")
+    page_count = max(math.ceil(total_rows / page_size), 1)
+    with col2:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1, key=f"{key}_page")
+    with col3:
+        st.caption(f"{total_rows:,} rows · page {page} of {page_count}")
+    return page, page_size
+
+
+def render_lease_grid(repo: LeaseRepository):
+    """Lease table with filtering, sorting and paging done in SQL."""
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+    with col1:
+        search = st.text_input("Search tenant name", key="lease_grid_search")
+    with col2:
+        status = st.selectbox("Status", ["All"] + repo.statuses(), key="lease_grid_status")
+    with col3:
+        sort_by = st.selectbox("Sort by", LEASE_COLUMNS, key="lease_grid_sort")
+    with col4:
+        descending = st.toggle("Descending", key="lease_grid_descending")
+
+    status = None if status == "All" else status
+    page, page_size = render_pager("lease_grid", repo.count(search, status))
+    rows = repo.query_page(search, status, sort_by, not descending, page, page_size)
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+
+def render_upload_preview(new_data: pd.DataFrame):
+    """Shows the head of an uploaded file instead of the whole thing."""
+    st.caption(f"Previewing {min(len(new_data), PREVIEW_ROWS):,} of {len(new_data):,} uploaded rows.")
+    st.dataframe(new_data.head(PREVIEW_ROWS), use_container_width=True, hide_index=True)
+
+
+def render_renewal_actions(scored: pd.DataFrame):
+    """
+    One grouped action list: pick a group, page through its tenants.
+
+    Leases above the offer threshold get a renewal offer; the rest need a
+    follow-up. Soonest-ending leases come first in each group.
+    """
+    offer = scored["renewal_chance"] > OFFER_THRESHOLD
+    groups = {
+        SEND_OFFER: scored[offer],
+        FOLLOW_UP: scored[~offer],
+    }
+    choice = st.radio(
+        "Action",
+        list(groups),
+        format_func=lambda name: f"{name} ({len(groups[name]):,})",
+        horizontal=True,
+        key="renewal_action_group"
+    )
+    actions = groups[choice].sort_values("days_to_end")
+    page, page_size = render_pager("renewal_actions", len(actions))
+    st.dataframe(
+        paginate(actions, page, page_size)[["tenant_id", "name", "lease_end", "days_to_end", "renewal_chance"]],
+        use_container_width=True,
+        hide_index=True
+    )
+
+
+def render_expiry_queues(repo: LeaseRepository):
+    """Upcoming expirations and renewal offers as precomputed by the daily job."""
+    run = last_run(repo)
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        if run is None:
+            st.info("The renewal job has not run yet.")
+        else:
+            st.caption(
+                f"Queues built for {run['run_date']} (finished {run['finished_at']} UTC, "
+                f"{int(run['rescored']):,} leases rescored)."
+            )
+    with col2:
+        if st.button("Run job now", key="renewal_job_run"):
+            summary = run_renewal_job(repo, force=True)
+            st.toast(f"Rescored {summary['rescored']:,} leases in {summary['elapsed_s']:.2f}s.")
+            st.rerun()
+
+    st.subheader("Upcoming Expirations")
+    window = st.radio(
+        "Expiring within", EXPIRY_WINDOWS, format_func=lambda days: f"{days} days",
+        horizontal=True, key="expiry_window"
+    )
+    expiring = expiry_queue(repo, window)
+    page, page_size = render_pager("expiry_queue", len(expiring))
+    st.dataframe(paginate(expiring, page, page_size), use_container_width=True, hide_index=True)
+
+    st.subheader("Renewal Offer Queue")
+    offers = renewal_queue(repo)
+    page, page_size = render_pager("renewal_queue", len(offers))
+    st.dataframe(paginate(offers, page, page_size), use_container_width=True, hide_index=True)
@@ -0,0 +1,118 @@
+# LeaseSync AI page (Project 6).
+# Loaded by app.py the first time the page is opened.
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from leasesync.expiry import run_renewal_job, save_scoring_settings, scoring_settings, start_scheduler
+from leasesync.grid import render_expiry_queues, render_lease_grid, render_renewal_actions, render_upload_preview
+from leasesync.repository import SAMPLE_LEASES, get_repository
+from leasesync.scoring import score_renewals
+from profiling import profiled_cache, section
+
+# --- Configuration ---
+# Above this many leases the dashboard charts rent by status instead of by tenant
+DASHBOARD_MAX_BARS = 50
+
+
+def render():
+    """Container for the LeaseSync AI project (Project 6)."""
+
+    # One pooled WAL connection per process (see leasesync/repository.py)
+    repo = get_repository()
+    # Daily renewal-window job; started once per process, runs at each local midnight
+    start_scheduler(repo)
+
+    # Lease data, re-read only after lease rows change; only the latest copy is kept
+    @profiled_cache(max_entries=1)
+    def load_data(version):
+        return repo.load()
+
+    # App Content Start
+    st.title("6. 🤖 LeaseSync AI (AI Integration & Data Analysis)")
+    
+    # Content starts here
+    data = load_data(repo.data_version())
+    
+    # Use tabs for the LeaseSync pages instead of the sidebar menu.
+    tab1, tab2, tab3, tab4 = st.tabs(["Lease Overview", "Renewal Predictions", "Dashboard", "Expiry Queue"])
+
+    with tab1:
+        st.header("Lease Management")
+        # Paged, sorted and filtered in SQL; only the visible page is sent to the browser
+        if data.empty:
+            st.info("No leases yet. Upload a CSV below, or load three sample leases to try the app.")
+            if st.button("Load Sample Leases"):
+                repo.upsert(SAMPLE_LEASES)
+                run_renewal_job(repo, force=True)
+                st.rerun()
+        with section("lease grid"):
+            render_lease_grid(repo)
+        st.write("Upload new lease data (CSV):")
+        uploaded_file = st.file_uploader("Choose file", type="csv")
+        if uploaded_file:
+            new_data = pd.read_csv(uploaded_file)
+            render_upload_preview(new_data)
+            if st.button("Save to Portfolio", type="primary"):
+                try:
+                    saved = repo.upsert(new_data)
+                except ValueError as e:
+                    st.error(f"Could not save leases: {e}")
+                else:
+                    # Refresh the queues now; only the leases that changed are rescored
+                    run_renewal_job(repo, force=True)
+                    # A toast outlives the rerun; st.success would be cleared by it
+                    st.toast(f"Saved {saved:,} leases.")
+                    st.rerun()
+
+    with tab2:
+        st.header("Renewal Predictions")
+
+        # Predict renewal likelihood (simple rule-based AI, vectorized in leasesync/scoring.py)
+        # Starts from the saved settings, which the daily job also scores with
+        saved_tiers, saved_chance = scoring_settings(repo)
+        with st.expander("Scoring Tiers"):
+            st.markdown("Leases ending in fewer than **within_days** days get that **renewal_chance** (%).")
+            tier_table = st.data_editor(
+                pd.DataFrame(saved_tiers, columns=["within_days", "renewal_chance"]),
+                num_rows="dynamic",
+                key="renewal_tiers"
+            )
+            default_chance = st.number_input(
+                "Renewal chance for all other leases (%)",
+                min_value=0, max_value=100, value=saved_chance,
+                key="renewal_default_chance"
+            )
+            tiers = list(tier_table.dropna().astype(int).itertuples(index=False, name=None))
+            if sorted(tiers) != sorted(saved_tiers) or default_chance != saved_chance:
+                st.caption("These edits are a preview: the Expiry Queue's renewal offers use the saved tiers.")
+                if st.button("Save Tiers and Rebuild Queues", key="renewal_tiers_save"):
+                    save_scoring_settings(repo, tiers, default_chance)
+                    run_renewal_job(repo, force=True)
+                    st.toast("Scoring tiers saved; renewal offers rebuilt.")
+                    st.rerun()
+
+        # Returns a new frame; the cached lease data is left untouched
+        with section("score renewals"):
+            scored = score_renewals(data, tiers=tiers, default_chance=default_chance)
+        # One grouped, paginated action list instead of an alert per tenant
+        with section("renewal actions"):
+            render_renewal_actions(scored)
+
+    with tab3:
+        st.header("Lease Dashboard")
+        with section("dashboard figure"):
+            if len(data) <= DASHBOARD_MAX_BARS:
+                fig = px.bar(data, x="name", y="rent", color="status", title="Rent by Tenant")
+            else:
+                # One bar per tenant stops being readable (or cheap) for large portfolios
+                by_status = data.groupby("status", as_index=False).agg(rent=("rent", "sum"), leases=("tenant_id", "count"))
+                fig = px.bar(by_status, x="status", y="rent", color="status", hover_data=["leases"],
+                             title="Total Rent by Lease Status")
+            st.plotly_chart(fig)
+
+    with tab4:
+        st.header("Expiry Queue")
+        with section("expiry queues"):
+            render_expiry_queues(repo)
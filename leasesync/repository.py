@@ -0,0 +1,196 @@
+# Lease repository for LeaseSync AI.
+# One SQLite connection per process (WAL mode, shared through
+# st.cache_resource), an indexed leases table, and bulk CSV ingest with
+# batched upserts inside a single transaction.
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import List, Optional, Sequence, Tuple
+
+import pandas as pd
+import streamlit as st
+
+# --- Configuration ---
+DB_PATH = "leases.db"
+UPSERT_BATCH_SIZE = 5_000
+LEASE_COLUMNS = ["tenant_id", "name", "lease_end", "rent", "status"]
+
+# Demo rows, loaded only when a user asks for them on an empty portfolio.
+SAMPLE_LEASES = pd.DataFrame({
+    "tenant_id": [1, 2, 3],
+    "name": ["John Doe", "Jane Smith", "Bob Lee"],
+    "lease_end": ["2026-01-15", "2025-11-30", "2025-12-20"],
+    "rent": [2000, 1800, 2200],
+    "status": ["Active", "Active", "Pending Renewal"]
+})
+
+# tenant_id is the INTEGER PRIMARY KEY (SQLite's rowid), so it is already
+# the table's clustered index; lease_end and status get secondary indexes.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    tenant_id  INTEGER PRIMARY KEY,
+    name       TEXT NOT NULL,
+    lease_end  TEXT NOT NULL,             -- ISO YYYY-MM-DD
+    rent       REAL NOT NULL,
+    status     TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+CREATE INDEX IF NOT EXISTS idx_leases_lease_end ON leases (lease_end);
+CREATE INDEX IF NOT EXISTS idx_leases_status ON leases (status);
+CREATE INDEX IF NOT EXISTS idx_leases_updated_at ON leases (updated_at);
+"""
+
+UPSERT_SQL = """
+INSERT INTO leases (tenant_id, name, lease_end, rent, status, updated_at)
+VALUES (?, ?, ?, ?, ?, datetime('now'))
+ON CONFLICT (tenant_id) DO UPDATE SET
+    name = excluded.name,
+    lease_end = excluded.lease_end,
+    rent = excluded.rent,
+    status = excluded.status,
+    updated_at = excluded.updated_at
+WHERE name IS NOT excluded.name OR lease_end IS NOT excluded.lease_end
+   OR rent IS NOT excluded.rent OR status IS NOT excluded.status
+"""
+
+
+def normalize_leases(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Validate an uploaded lease frame and coerce it to the table's types.
+
+    Raises ValueError naming any missing columns or unparseable values.
+    """
+    columns = {str(column).strip().lower(): column for column in data.columns}
+    missing = [column for column in LEASE_COLUMNS if column not in columns]
+    if missing:
+        raise ValueError(f"Missing required column(s): {', '.join(missing)}")
+
+    leases = pd.DataFrame({column: data[columns[column]] for column in LEASE_COLUMNS})
+    leases["tenant_id"] = pd.to_numeric(leases["tenant_id"], errors="coerce")
+    leases["rent"] = pd.to_numeric(leases["rent"], errors="coerce")
+    leases["lease_end"] = pd.to_datetime(leases["lease_end"], errors="coerce", format="mixed")
+
+    bad = leases[["tenant_id", "rent", "lease_end"]].isna().any(axis=1)
+    if bad.any():
+        raise ValueError(f"{int(bad.sum())} row(s) have an invalid tenant_id, rent or lease_end.")
+
+    leases["tenant_id"] = leases["tenant_id"].astype("int64")
+    leases["lease_end"] = leases["lease_end"].dt.strftime("%Y-%m-%d")
+    leases["name"] = leases["name"].fillna("").astype(str)
+    leases["status"] = leases["status"].fillna("Active").astype(str)
+    # Last row wins when a file repeats a tenant.
+    return leases.drop_duplicates("tenant_id", keep="last")
+
+
+class LeaseRepository:
+    """Process-wide access to the leases table; every statement runs under one lock."""
+
+    def __init__(self, path: str = DB_PATH):
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(SCHEMA)
+        # Bumped after each upsert that changed lease rows; see data_version().
+        self.version = 0
+
+    @contextmanager
+    def transaction(self):
+        """Run a block of statements atomically under the repository lock."""
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def upsert(self, data: pd.DataFrame, batch_size: int = UPSERT_BATCH_SIZE) -> int:
+        """
+        Insert or update leases keyed on tenant_id, all in one transaction.
+
+        Rows are bound in batches with executemany, so a file of tens of
+        thousands of leases commits once instead of once per row. Unchanged
+        rows keep their updated_at, so the daily job only rescores real edits.
+        """
+        leases = normalize_leases(data)
+        rows = list(leases[LEASE_COLUMNS].itertuples(index=False, name=None))
+        with self.transaction() as conn:
+            before = conn.total_changes
+            for start in range(0, len(rows), batch_size):
+                conn.executemany(UPSERT_SQL, rows[start:start + batch_size])
+            changed = conn.total_changes - before
+        if changed:
+            self.version += 1
+        return len(rows)
+
+    def data_version(self) -> Tuple[int, int]:
+        """
+        Cache key for load() that changes only when lease rows may have changed.
+
+        The counter covers this process's upserts; SQLite's data_version
+        changes when another process commits to the shared database file.
+        """
+        with self._lock:
+            return self.version, self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    @staticmethod
+    def _filters(search: str, status: Optional[str]) -> Tuple[str, list]:
+        """WHERE clause and parameters for the grid's name search and status filter."""
+        clauses, params = [], []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if search:
+            clauses.append("name LIKE ?")
+            params.append(f"%{search}%")
+        return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    def count(self, search: str = "", status: Optional[str] = None) -> int:
+        """Number of leases matching the optional filters."""
+        where, params = self._filters(search, status)
+        with self._lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM leases {where}", params).fetchone()[0]
+
+    def statuses(self) -> List[str]:
+        """Distinct lease statuses, read off the status index."""
+        with self._lock:
+            return [row[0] for row in self.conn.execute("SELECT DISTINCT status FROM leases ORDER BY status")]
+
+    def query_page(self, search: str = "", status: Optional[str] = None, sort_by: str = "tenant_id",
+                   ascending: bool = True, page: int = 1, page_size: int = 50) -> pd.DataFrame:
+        """
+        One page of leases, filtered and sorted in SQL.
+
+        Only `page_size` rows ever leave the database, whatever the portfolio size.
+        """
+        if sort_by not in LEASE_COLUMNS:
+            raise ValueError(f"Cannot sort by '{sort_by}'.")
+        where, params = self._filters(search, status)
+        order = f"{sort_by} {'ASC' if ascending else 'DESC'}, tenant_id"
+        offset = (max(int(page), 1) - 1) * page_size
+        with self._lock:
+            return pd.read_sql_query(
+                f"SELECT {', '.join(LEASE_COLUMNS)} FROM leases {where} ORDER BY {order} LIMIT ? OFFSET ?",
+                self.conn, params=params + [page_size, offset]
+            )
+
+    def read_sql(self, sql: str, params: Sequence = ()) -> pd.DataFrame:
+        """Run a read query under the repository lock."""
+        with self._lock:
+            return pd.read_sql_query(sql, self.conn, params=list(params))
+
+    def load(self) -> pd.DataFrame:
+        """Every lease, ordered by tenant_id."""
+        with self._lock:
+            return pd.read_sql_query(
+                f"SELECT {', '.join(LEASE_COLUMNS)} FROM leases ORDER BY tenant_id", self.conn
+            )
+
+
+@st.cache_resource
+def get_repository() -> LeaseRepository:
+    """The process-wide lease repository, opened once and shared by every session."""
+    return LeaseRepository()
@@ -0,0 +1,55 @@
+# Renewal scoring for LeaseSync AI.
+# Scores a whole portfolio at once with pandas/NumPy: lease_end is parsed
+# in one vectorized call and each lease is bucketed into a configurable
+# day-window tier with a single searchsorted.
+
+import datetime
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# --- Configuration ---
+# (within_days, renewal_chance): leases ending in fewer than `within_days`
+# days get that chance. The defaults reproduce the original rule:
+# under 60 days -> 80%, everything else -> 50%.
+DEFAULT_TIERS: List[Tuple[int, int]] = [(60, 80)]
+DEFAULT_CHANCE = 50
+OFFER_THRESHOLD = 60
+
+
+def days_to_end(lease_end: pd.Series, now: Optional[datetime.datetime] = None) -> np.ndarray:
+    """
+    Whole days from `now` until each lease_end (negative once expired).
+
+    Floors like timedelta.days, so results match the old per-row
+    (strptime(date) - now).days computation exactly.
+    """
+    now = pd.Timestamp(now if now is not None else datetime.datetime.now())
+    ends = pd.to_datetime(lease_end, format="%Y-%m-%d").to_numpy(dtype="datetime64[ns]")
+    return (ends - now.to_datetime64()) // np.timedelta64(1, "D")
+
+
+def tier_chances(days: np.ndarray, tiers: Sequence[Tuple[int, int]] = DEFAULT_TIERS,
+                 default_chance: int = DEFAULT_CHANCE) -> np.ndarray:
+    """Map days-to-end onto renewal chances using sorted day-window tiers."""
+    ordered = sorted(tiers)
+    bounds = np.array([within_days for within_days, _ in ordered])
+    chances = np.array([chance for _, chance in ordered] + [default_chance])
+    return chances[np.searchsorted(bounds, days, side="right")]
+
+
+def score_renewals(leases: pd.DataFrame, now: Optional[datetime.datetime] = None,
+                   tiers: Sequence[Tuple[int, int]] = DEFAULT_TIERS,
+                   default_chance: int = DEFAULT_CHANCE) -> pd.DataFrame:
+    """
+    Return a new frame with days_to_end and renewal_chance columns added.
+
+    The input frame is never modified, so it is safe to pass the result of
+    an st.cache_data function.
+    """
+    days = days_to_end(leases["lease_end"], now)
+    return leases.assign(
+        days_to_end=days,
+        renewal_chance=tier_chances(days, tiers, default_chance),
+    )
@@ -4,6 +4,8 @@ import json
 import time
 from typing import Dict, Any, List
 
+from profiling import profiled_cache, profiled_rerun
+
 # --- Configuration ---
 # API Key is read directly from the Streamlit Secrets manager
 API_KEY = st.secrets.tool_auth.gemini_api_key
@@ -13,7 +15,7 @@ MAX_RETRIES = 5
 
 # --- Core LLM Function with Google Search Grounding ---
 
-@st.cache_data(show_spinner=False)
+@profiled_cache(show_spinner=False)
 def fact_check_claim(claim: str) -> Dict[str, Any]:
     """
     Sends a political claim to the Gemini model, forcing it to look up 
@@ -138,4 +140,6 @@ def main():
             st.warning("Please enter a claim to begin verification.")
 
 if __name__ == "__main__":
-    main()
+    # Opt-in rerun profiling (?profile=1), see profiling.py
+    with profiled_rerun("political_fact_checker"):
+        main()
@@ -0,0 +1,36 @@
+# Shared worker pool for the dashboard's CPU-bound batch jobs.
+# The Web Scraper's extraction and the Sentiment Analyzer's batch scoring
+# submit to one process pool per server process instead of each keeping
+# their own. A worker that dies (out of memory, a crash in a C extension)
+# breaks the pool for every later task, so callers catch BrokenProcessPool,
+# call discard_pool() and report the error; the next run spawns fresh workers.
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+# --- Configuration ---
+POOL_WORKERS = os.cpu_count() or 1
+
+
+@st.cache_resource
+def get_pool(workers: int = POOL_WORKERS) -> ProcessPoolExecutor:
+    """
+    The process-wide worker pool.
+
+    Workers are spawned rather than forked, since the Streamlit server
+    process is multi-threaded.
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def discard_pool(pool: ProcessPoolExecutor):
+    """Shut down a broken pool and drop it from the cache, so the next get_pool() starts a new one."""
+    logger.warning("Worker pool broke; starting a new one on the next run.")
+    pool.shutdown(wait=False, cancel_futures=True)
+    get_pool.clear()
@@ -4,6 +4,8 @@ import json
 import time
 from typing import Dict, Any, List
 
+from profiling import profiled_cache, profiled_rerun
+
 # --- Configuration ---
 # API Key is read directly from the Streamlit Secrets manager (already configured)
 API_KEY = st.secrets.tool_auth.gemini_api_key
@@ -13,7 +15,7 @@ MAX_RETRIES = 5
 
 # --- Core LLM Function with Google Search Grounding ---
 
-@st.cache_data(show_spinner=False)
+@profiled_cache(show_spinner=False)
 def challenge_premise(premise: str) -> Dict[str, Any]:
     """
     Sends a premise to the Gemini model with Google Search enabled to force 
@@ -140,4 +142,6 @@ def main():
             st.warning("Please enter a premise to begin the critical analysis.")
 
 if __name__ == "__main__":
-    main()
+    # Opt-in rerun profiling (?profile=1), see profiling.py
+    with profiled_rerun("premise_challenger"):
+        main()
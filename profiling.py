@@ -0,0 +1,261 @@
+# Opt-in rerun profiler for the portfolio dashboard and the analyzer apps.
+# Turn it on with ?profile=1 in the page URL or PORTFOLIO_PROFILE=1 in the
+# server environment. Each rerun records named sections (nested, with their
+# offsets) and st.cache_* hits and misses; the sidebar shows the last rerun
+# as a waterfall, and per-section percentiles across all sessions are
+# exported to a local JSON file.
+# When profiling is off, section() and profiled_cache() cost one
+# context-variable lookup per call. app.py imports this module on every
+# start, so numpy, pandas and plotly are imported only where they are used.
+
+import contextlib
+import contextvars
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
+
+import streamlit as st
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# --- Configuration ---
+ENV_FLAG = "PORTFOLIO_PROFILE"
+QUERY_FLAG = "profile"
+EXPORT_PATH = os.environ.get("PORTFOLIO_PROFILE_PATH", "profile_stats.json")
+# Percentiles are computed over the most recent samples of each section
+SAMPLES_PER_SECTION = 2_000
+# Write the percentile file automatically every this many profiled reruns
+EXPORT_EVERY = 25
+# Reruns kept in each session for the sidebar
+HISTORY_RERUNS = 10
+HISTORY_KEY = "_profiler_history"
+RERUN_SECTION = "(rerun total)"
+
+_current: contextvars.ContextVar[Optional["RerunProfile"]] = contextvars.ContextVar("rerun_profile", default=None)
+
+
+def profiling_enabled() -> bool:
+    """True when the server environment or the page URL asks for profiling."""
+    if os.environ.get(ENV_FLAG, "").lower() in ("1", "true", "yes"):
+        return True
+    try:
+        return st.query_params.get(QUERY_FLAG) in ("1", "true")
+    except Exception:
+        # No script run context (plain imports, benchmarks)
+        return False
+
+
+class RerunProfile:
+    """Timings for one script rerun: sections in the order they finished, offsets in ms from the start."""
+
+    def __init__(self, app: str):
+        self.app = app
+        self.started_at = datetime.datetime.now().strftime("%H:%M:%S")
+        self.start = time.perf_counter()
+        self.sections: List[Dict[str, Any]] = []
+        self.misses: Counter = Counter()
+        self.depth = 0
+        self.total_ms = 0.0
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.start) * 1000
+
+    def add(self, name: str, start_ms: float, kind: str = "section"):
+        self.sections.append({
+            "section": name,
+            "kind": kind,
+            "depth": self.depth,
+            "start_ms": start_ms,
+            "ms": self.elapsed_ms() - start_ms,
+        })
+
+    def summary(self) -> Dict[str, Any]:
+        """Plain-data form kept in session state."""
+        return {
+            "app": self.app,
+            "started_at": self.started_at,
+            "total_ms": self.total_ms,
+            "sections": sorted(self.sections, key=lambda s: s["start_ms"]),
+        }
+
+
+@contextlib.contextmanager
+def section(name: str) -> Iterator[None]:
+    """Time a named block of the current rerun; does nothing unless profiling."""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    start_ms = profile.elapsed_ms()
+    profile.depth += 1
+    try:
+        yield
+    finally:
+        profile.depth -= 1
+        profile.add(name, start_ms)
+
+
+def profiled_cache(cache: Optional[Callable] = None, *, name: Optional[str] = None,
+                   **options) -> Callable[[Callable], Callable]:
+    """
+    Drop-in for @st.cache_data(**options) / @st.cache_resource(**options) that
+    times each call and records whether it was a hit or a miss.
+
+    The function body only runs on a miss, so a counter bumped inside it
+    tells the two apart. The cache key is unchanged: Streamlit hashes the
+    wrapped function's name and source.
+    """
+    cache = cache or st.cache_data
+
+    def decorate(func: Callable) -> Callable:
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def compute(*args, **kwargs):
+            profile = _current.get()
+            if profile is not None:
+                profile.misses[label] += 1
+            return func(*args, **kwargs)
+
+        cached = cache(**options)(compute)
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            profile = _current.get()
+            if profile is None:
+                return cached(*args, **kwargs)
+            misses = profile.misses[label]
+            start_ms = profile.elapsed_ms()
+            result = cached(*args, **kwargs)
+            profile.add(label, start_ms, "cache miss" if profile.misses[label] > misses else "cache hit")
+            return result
+
+        call.clear = cached.clear
+        return call
+
+    return decorate
+
+
+class ProfileStats:
+    """Process-wide samples per (app, section) and cache hit/miss counts, shared by all sessions."""
+
+    def __init__(self, samples: int = SAMPLES_PER_SECTION):
+        self._lock = threading.Lock()
+        self._samples = defaultdict(lambda: deque(maxlen=samples))
+        self._cache = defaultdict(Counter)
+        self.reruns = 0
+
+    def add(self, profile: RerunProfile):
+        with self._lock:
+            self.reruns += 1
+            self._samples[(profile.app, RERUN_SECTION)].append(profile.total_ms)
+            for s in profile.sections:
+                self._samples[(profile.app, s["section"])].append(s["ms"])
+                if s["kind"] != "section":
+                    self._cache[(profile.app, s["section"])][s["kind"]] += 1
+
+    def percentiles(self) -> "pd.DataFrame":
+        """One row per (app, section): sample count, p50/p90/p99/max in ms, and cache hit rate."""
+        import numpy as np
+        import pandas as pd
+
+        with self._lock:
+            items = [(key, np.array(values)) for key, values in self._samples.items()]
+            cache = {key: dict(counts) for key, counts in self._cache.items()}
+        rows = []
+        for (app, name), values in items:
+            p50, p90, p99 = np.percentile(values, [50, 90, 99])
+            counts = cache.get((app, name))
+            rows.append({
+                "app": app, "section": name, "samples": len(values),
+                "p50_ms": p50, "p90_ms": p90, "p99_ms": p99, "max_ms": values.max(),
+                "cache_hit_rate": (counts.get("cache hit", 0) / sum(counts.values())) if counts else None,
+            })
+        return pd.DataFrame(rows).sort_values(["app", "p90_ms"], ascending=[True, False]) if rows else pd.DataFrame()
+
+    def export(self, path: str = EXPORT_PATH) -> str:
+        """Write the percentiles as JSON (written to a temp file, then renamed); returns the path."""
+        table = self.percentiles().round(3)
+        report = {
+            "exported_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "reruns": self.reruns,
+            # NaN (no cache events) becomes null, keeping the file valid JSON
+            "sections": table.astype(object).where(table.notna(), None).to_dict(orient="records"),
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, default=str)
+        os.replace(tmp_path, path)
+        return path
+
+
+@st.cache_resource
+def get_profile_stats() -> ProfileStats:
+    """The process-wide profile aggregate."""
+    return ProfileStats()
+
+
+@contextlib.contextmanager
+def profiled_rerun(app: str) -> Iterator[Optional[RerunProfile]]:
+    """
+    Profile one rerun of an app's script when profiling is enabled.
+
+    The rerun is recorded even if it ends in st.rerun()/st.stop() or an
+    error; the sidebar waterfall is only drawn after a normal finish.
+    """
+    if not profiling_enabled():
+        yield None
+        return
+    profile = RerunProfile(app)
+    token = _current.set(profile)
+    try:
+        yield profile
+    finally:
+        _current.reset(token)
+        profile.total_ms = profile.elapsed_ms()
+        stats = get_profile_stats()
+        stats.add(profile)
+        if stats.reruns % EXPORT_EVERY == 0:
+            stats.export()
+        history = st.session_state.get(HISTORY_KEY, [])[-(HISTORY_RERUNS - 1):]
+        st.session_state[HISTORY_KEY] = history + [profile.summary()]
+    render_profile_sidebar()
+
+
+def render_profile_sidebar():
+    """Collapsible waterfall of the latest rerun, recent rerun totals, and the export button."""
+    import pandas as pd
+    import plotly.express as px
+
+    history = st.session_state.get(HISTORY_KEY, [])
+    if not history:
+        return
+    latest = history[-1]
+    with st.sidebar.expander(f"⏱️ Rerun profile: {latest['total_ms']:.0f} ms"):
+        if latest["sections"]:
+            frame = pd.DataFrame(latest["sections"])
+            frame["label"] = ["  " * depth + name for depth, name in zip(frame["depth"], frame["section"])]
+            fig = px.bar(frame, x="ms", base="start_ms", y="label", color="kind", orientation="h",
+                         color_discrete_map={"section": "#636efa", "cache hit": "#00cc96", "cache miss": "#ef553b"},
+                         hover_data={"ms": ":.1f", "start_ms": ":.1f", "label": False})
+            fig.update_yaxes(autorange="reversed", title=None)
+            fig.update_layout(height=120 + 22 * len(frame), margin=dict(l=0, r=0, t=10, b=0),
+                              xaxis_title="ms since rerun start", legend_title=None)
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.caption("No instrumented sections ran.")
+
+        st.caption("Recent reruns")
+        st.dataframe(
+            pd.DataFrame([{"at": run["started_at"], "total_ms": round(run["total_ms"], 1),
+                           "sections": len(run["sections"])} for run in reversed(history)]),
+            hide_index=True, use_container_width=True
+        )
+        if st.button("Export percentiles", key="_profiler_export"):
+            st.success(f"Wrote {get_profile_stats().export()}")
@@ -0,0 +1 @@
+"""Batch and fast-path scoring behind the Sentiment Analyzer page (Project 3)."""
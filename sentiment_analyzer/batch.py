@@ -0,0 +1,131 @@
+# Batch mode for the Sentiment Analyzer.
+# An uploaded review export is read in chunks, each chunk is cut into tasks
+# that a process pool scores with TextBlob on every core, and the scored
+# rows are streamed into a CSV while polarity/subjectivity histograms are
+# accumulated on fixed bins.
+
+import io
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from textblob import TextBlob
+
+# --- Configuration ---
+CHUNK_ROWS = 20_000
+TASK_ROWS = 2_000
+CHUNKS_IN_FLIGHT = 2
+HISTOGRAM_BINS = 20
+TEXT_COLUMN_HINTS = ["review", "text", "review_text", "content", "comment", "body", "message"]
+
+
+def score_textblob(texts: Sequence[str]) -> np.ndarray:
+    """(n, 2) array of TextBlob polarity and subjectivity, one text at a time."""
+    scores = np.zeros((len(texts), 2))
+    for row, text in enumerate(texts):
+        scores[row] = TextBlob(text).sentiment
+    return scores
+
+
+def sentiment_labels(polarity: np.ndarray) -> np.ndarray:
+    """Positive / Negative / Neutral from the sign of the polarity."""
+    return np.select([polarity > 0, polarity < 0], ["Positive", "Negative"], "Neutral")
+
+
+def guess_text_column(columns: List[str]) -> int:
+    """Index of the column that most likely holds the review text (0 if none looks like it)."""
+    lowered = [str(column).strip().lower() for column in columns]
+    for hint in TEXT_COLUMN_HINTS:
+        if hint in lowered:
+            return lowered.index(hint)
+    return 0
+
+
+class SentimentHistogram:
+    """Running polarity and subjectivity counts on fixed bins, so chunks can be added as they finish."""
+
+    def __init__(self, bins: int = HISTOGRAM_BINS):
+        self.polarity_edges = np.linspace(-1.0, 1.0, bins + 1)
+        self.subjectivity_edges = np.linspace(0.0, 1.0, bins + 1)
+        self.polarity_counts = np.zeros(bins, dtype=np.int64)
+        self.subjectivity_counts = np.zeros(bins, dtype=np.int64)
+
+    def add(self, polarity: np.ndarray, subjectivity: np.ndarray):
+        self.polarity_counts += np.histogram(polarity, bins=self.polarity_edges)[0]
+        self.subjectivity_counts += np.histogram(subjectivity, bins=self.subjectivity_edges)[0]
+
+    @staticmethod
+    def _frame(edges: np.ndarray, counts: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame({"bin": (edges[:-1] + edges[1:]) / 2, "reviews": counts})
+
+    def polarity(self) -> pd.DataFrame:
+        return self._frame(self.polarity_edges, self.polarity_counts)
+
+    def subjectivity(self) -> pd.DataFrame:
+        return self._frame(self.subjectivity_edges, self.subjectivity_counts)
+
+
+def _submit_chunk(pool: ProcessPoolExecutor, scorer: Callable[[Sequence[str]], np.ndarray],
+                  texts: List[str]) -> list:
+    """Split one chunk's texts into pool tasks."""
+    return [pool.submit(scorer, texts[start:start + TASK_ROWS]) for start in range(0, len(texts), TASK_ROWS)]
+
+
+def score_file(file, text_column: str, pool: Optional[ProcessPoolExecutor] = None,
+               scorer: Callable[[Sequence[str]], np.ndarray] = score_textblob,
+               chunk_rows: int = CHUNK_ROWS) -> Iterator[Tuple[pd.DataFrame, float]]:
+    """
+    Yield (scored chunk, fraction of the file read) for a CSV, in file order.
+
+    Each chunk gains polarity, subjectivity and sentiment columns. Up to
+    CHUNKS_IN_FLIGHT chunks are queued on the pool at once, so the next
+    chunk is being parsed and scored while the current one is collected.
+    Without a pool, chunks are scored in this process.
+    """
+    size = max(getattr(file, "size", 0) or 0, 1)
+    pending = deque()
+
+    def finish(chunk: pd.DataFrame, scores: np.ndarray, position: int) -> Tuple[pd.DataFrame, float]:
+        chunk["polarity"] = scores[:, 0]
+        chunk["subjectivity"] = scores[:, 1]
+        chunk["sentiment"] = sentiment_labels(scores[:, 0])
+        return chunk, min(position / size, 1.0)
+
+    for chunk in pd.read_csv(file, chunksize=chunk_rows):
+        if text_column not in chunk.columns:
+            raise ValueError(f"Column '{text_column}' not found in the file.")
+        texts = chunk[text_column].fillna("").astype(str).tolist()
+        position = file.tell() if hasattr(file, "tell") else size
+        if pool is None:
+            yield finish(chunk, scorer(texts), position)
+            continue
+        pending.append((chunk, _submit_chunk(pool, scorer, texts), position))
+        if len(pending) >= CHUNKS_IN_FLIGHT:
+            chunk, futures, position = pending.popleft()
+            yield finish(chunk, np.vstack([future.result() for future in futures]), position)
+
+    while pending:
+        chunk, futures, position = pending.popleft()
+        yield finish(chunk, np.vstack([future.result() for future in futures]), position)
+
+
+def score_to_csv(file, text_column: str, pool: Optional[ProcessPoolExecutor] = None,
+                 scorer: Callable[[Sequence[str]], np.ndarray] = score_textblob,
+                 progress: Optional[Callable[[float, int], None]] = None) -> Tuple[bytes, SentimentHistogram, int]:
+    """
+    Score a whole CSV; returns (scored CSV bytes, histograms, row count).
+
+    `progress(fraction, rows_done)` is called after every chunk.
+    """
+    histogram = SentimentHistogram()
+    output = io.StringIO()
+    rows = 0
+    for chunk, fraction in score_file(file, text_column, pool=pool, scorer=scorer):
+        chunk.to_csv(output, header=rows == 0, index=False)
+        histogram.add(chunk["polarity"].to_numpy(), chunk["subjectivity"].to_numpy())
+        rows += len(chunk)
+        if progress is not None:
+            progress(fraction, rows)
+    return output.getvalue().encode("utf-8"), histogram, rows
@@ -0,0 +1,147 @@
+# Fast lexicon scorer for the Sentiment Analyzer.
+# Re-implements TextBlob's default (pattern) polarity and subjectivity:
+# the sentiment lexicon is flattened once into plain lookup tables, text is
+# tokenized with one compiled regex, each distinct sentence is scored once
+# (memoized in a bounded LRU), and per-review averages are summed over
+# sentences with NumPy.
+
+import functools
+import re
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from textblob.en import sentiment as pattern_sentiment
+from textblob._text import EMOTICONS
+
+# --- Configuration ---
+SENTENCE_CACHE_SIZE = 200_000
+NEGATIONS = frozenset(pattern_sentiment.negations)
+EXCLAMATION_BOOST = 1.25
+NEGATION_FACTOR = -0.5
+
+
+def _build_lexicon() -> Dict[str, Tuple[float, float, float, bool]]:
+    """
+    word -> (polarity, subjectivity, intensity, is_modifier), flattened from TextBlob's lexicon.
+
+    TextBlob scores plain strings with the part-of-speech-averaged entry
+    (key None), and treats a word as a modifier when any sense is an adverb.
+    """
+    pattern_sentiment.load()
+    lexicon = {}
+    for word, senses in dict.items(pattern_sentiment):
+        polarity, subjectivity, intensity = senses[None]
+        lexicon[word] = (float(polarity), float(subjectivity), float(intensity), "RB" in senses)
+    return lexicon
+
+
+LEXICON = _build_lexicon()
+EMOTICON_POLARITY = {
+    emoticon.lower(): polarity for (_, polarity), emoticons in EMOTICONS.items() for emoticon in emoticons
+}
+
+# Tokens, in priority order: sarcasm "(!)", emoticons (when followed by a
+# space or the end), "...", words with any inner punctuation except quotes
+# ("well-made", "u.s"), then every other symbol on its own. Apostrophes are
+# split off as TextBlob does, so "don't" becomes do / n / ' / t.
+SARCASM = re.compile(r"\(\s?!\s?\)")
+_EMOTICONS = sorted((e for e in EMOTICON_POLARITY if not e.isalpha()), key=len, reverse=True)
+TOKEN = re.compile(
+    r"\(!\)"
+    # The lookahead on first characters lets ordinary words skip the emoticon alternation.
+    r"|(?=[" + re.escape("".join({e[0] for e in _EMOTICONS})) + r"])"
+    r"(?:" + "|".join(map(re.escape, _EMOTICONS)) + r")(?=\s|$)"
+    r"|\.\.\."
+    r"|\w(?:[^\s'\"‘’“”]*\w)?"
+    r"|[^\w\s]"
+)
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+WHITESPACE = re.compile(r"\s+")
+
+
+def _clamp(value: float) -> float:
+    return -1.0 if value < -1.0 else 1.0 if value > 1.0 else value
+
+
+def tokenize(sentence: str) -> list:
+    """Lowercased tokens of one sentence, split the way TextBlob's tokenizer splits them."""
+    return TOKEN.findall(SARCASM.sub("(!)", sentence.lower()))
+
+
+@functools.lru_cache(maxsize=SENTENCE_CACHE_SIZE)
+def score_sentence(sentence: str) -> Tuple[float, float, int]:
+    """
+    (polarity sum, subjectivity sum, assessment count) for one normalized sentence.
+
+    The same negation, modifier and exclamation rules as TextBlob's
+    Sentiment.assessments(), on flat tuples instead of per-word dicts.
+    """
+    assessments = []  # [polarity, subjectivity, intensity, negated]
+    modifier = None
+    negation = None
+    for word in tokenize(sentence):
+        entry = LEXICON.get(word)
+        if entry is not None:
+            polarity, subjectivity, intensity, is_modifier = entry
+            if modifier is None:
+                assessments.append([polarity, subjectivity, intensity, False])
+            else:
+                # "very good": the preceding modifier scales this word's scores.
+                last = assessments[-1]
+                last[0] = _clamp(polarity * last[2])
+                last[1] = _clamp(subjectivity * last[2])
+                last[2] = intensity
+            if negation is not None:
+                last = assessments[-1]
+                last[2] = 1.0 / last[2]
+                last[3] = True
+            modifier = word if is_modifier else None
+            negation = word if word in NEGATIONS else None
+            continue
+
+        if word in NEGATIONS:
+            negation = word
+        elif negation and len(word.strip("'")) > 1:
+            # Negation carries across small words only ("not a good").
+            negation = None
+        if negation is not None and modifier is not None and modifier.endswith("ly"):
+            # "really not good"
+            assessments[-1][3] = True
+            negation = None
+        elif modifier and len(word) > 2:
+            modifier = None
+        if word == "!" and assessments:
+            assessments[-1][0] = _clamp(assessments[-1][0] * EXCLAMATION_BOOST)
+        if word == "(!)":
+            assessments.append([0.0, 1.0, 1.0, False])
+        elif word in EMOTICON_POLARITY and not word.isalpha():
+            assessments.append([EMOTICON_POLARITY[word], 1.0, 1.0, False])
+
+    polarity = sum(p * NEGATION_FACTOR if negated else p for p, _, _, negated in assessments)
+    subjectivity = sum(s for _, s, _, _ in assessments)
+    return polarity, subjectivity, len(assessments)
+
+
+def score_fast(texts: Sequence[str]) -> np.ndarray:
+    """
+    (n, 2) array of polarity and subjectivity for a batch of texts.
+
+    Texts are split into sentences, every distinct sentence in the batch is
+    scored once, and each review's scores are the assessment-weighted
+    averages over its sentences, computed with bincount.
+    """
+    sentences = (
+        pd.Series(texts, dtype=object).fillna("").astype(str)
+        .str.split(SENTENCE_END).explode()
+    )
+    normalized = sentences.str.lower().str.replace(WHITESPACE, " ", regex=True).str.strip()
+    codes, unique = pd.factorize(normalized)
+    unique_scores = np.array([score_sentence(sentence) for sentence in unique], dtype=float).reshape(-1, 3)
+    scores = unique_scores[codes]
+
+    rows = sentences.index.to_numpy()
+    totals = np.column_stack([np.bincount(rows, weights=scores[:, column], minlength=len(texts))
+                              for column in range(3)])
+    counts = np.maximum(totals[:, 2], 1)
+    return np.column_stack([totals[:, 0] / counts, totals[:, 1] / counts])
@@ -0,0 +1,83 @@
+# Sentiment Analyzer page (Project 3).
+# Loaded by app.py the first time the page is opened.
+
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+from textblob import TextBlob
+
+from pools import discard_pool, get_pool
+from sentiment_analyzer.batch import guess_text_column, score_textblob, score_to_csv
+from sentiment_analyzer.fast import score_fast
+
+# --- Configuration ---
+# Batch scorers; the fast path matches TextBlob polarity (see benchmarks/bench_sentiment.py)
+SENTIMENT_SCORERS = {"Fast lexicon": score_fast, "TextBlob (exact)": score_textblob}
+
+
+def render():
+    """Container for the Sentiment Analyzer project (Project 3)."""
+    st.title("3. 💬 Sentiment Analyzer (NLP)")
+    st.markdown("**(https://github.com/lisa-silva/online-review-sentiment-analyzer.git)**")
+
+    st.header("1. Analyze a Review")
+    review = st.text_area("Review text", placeholder="Great product, fast shipping!", key="sentiment_review")
+    if review.strip():
+        polarity, subjectivity = TextBlob(review).sentiment
+        label = "Positive" if polarity > 0 else "Negative" if polarity < 0 else "Neutral"
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Sentiment", label)
+        col2.metric("Polarity", f"{polarity:+.3f}")
+        col3.metric("Subjectivity", f"{subjectivity:.3f}")
+
+    st.header("2. Batch Mode")
+    st.write("Upload a CSV of reviews; it is scored in chunks on every CPU core.")
+    uploaded_file = st.file_uploader("Choose a CSV file", type="csv", key="sentiment_uploader")
+    if uploaded_file is not None:
+        columns = list(pd.read_csv(uploaded_file, nrows=0).columns)
+        uploaded_file.seek(0)
+        text_column = st.selectbox("Text column", columns, index=guess_text_column(columns),
+                                   key="sentiment_text_column")
+        scorer = st.radio("Scorer", list(SENTIMENT_SCORERS), horizontal=True, key="sentiment_scorer",
+                          help="The fast lexicon scorer reproduces TextBlob's polarity and caches repeated sentences.")
+
+        if st.button("Score File", type="primary"):
+            progress = st.progress(0.0, text="Scoring...")
+            start_time = time.perf_counter()
+            pool = get_pool()
+            try:
+                scored, histogram, rows = score_to_csv(
+                    uploaded_file, text_column, pool=pool, scorer=SENTIMENT_SCORERS[scorer],
+                    progress=lambda fraction, done: progress.progress(fraction, text=f"Scored {done:,} rows")
+                )
+            except (ValueError, pd.errors.ParserError) as e:
+                st.error(f"Could not score the file: {e}")
+            except BrokenProcessPool:
+                discard_pool(pool)
+                st.error("A scoring worker exited unexpectedly. Press Score File again to retry with fresh workers.")
+            else:
+                st.session_state.sentiment_batch = {
+                    "name": uploaded_file.name,
+                    "scorer": scorer,
+                    "csv": scored,
+                    "rows": rows,
+                    "elapsed": time.perf_counter() - start_time,
+                    "polarity": histogram.polarity(),
+                    "subjectivity": histogram.subjectivity(),
+                }
+            progress.empty()
+
+    batch = st.session_state.get("sentiment_batch")
+    if batch:
+        st.success(f"Scored {batch['rows']:,} rows of {batch['name']} with {batch['scorer']} "
+                   f"in {batch['elapsed']:.1f}s ({batch['rows'] / max(batch['elapsed'], 1e-9):,.0f} rows/s).")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(px.bar(batch["polarity"], x="bin", y="reviews", title="Polarity"))
+        with col2:
+            st.plotly_chart(px.bar(batch["subjectivity"], x="bin", y="reviews", title="Subjectivity"))
+        st.download_button("Download Scored CSV", batch["csv"],
+                           file_name=f"scored_{batch['name']}", mime="text/csv")
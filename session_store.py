@@ -0,0 +1,512 @@
+# Shared session-state backend for the portfolio dashboard.
+# The session-state keys in PERSISTED_KEYS (quiz progress and the analyzer
+# results) are written through to an external store at the end of each
+# rerun, only when their value changed, and restored from the ?session=
+# resume token in the URL. Any replica can therefore serve any request, and
+# a restarted pod loses nothing.
+# PORTFOLIO_SESSION_BACKEND picks the store:
+#   unset, or sqlite:///path   a local SQLite file (default session_state.db)
+#   redis://[:password@]host:port/db   Redis, or any server speaking its protocol
+#   off                        keep state in this process only
+# Only session-state keys live here. The finance ledger is a separate SQLite
+# database (PORTFOLIO_LEDGER_DB) keyed by the same token; replicas share it
+# only by opening the same file.
+
+import base64
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+import secrets
+import socket
+import sys
+import threading
+import time
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from urllib.parse import unquote, urlparse
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+# --- Configuration ---
+BACKEND_ENV = "PORTFOLIO_SESSION_BACKEND"
+DB_PATH = "session_state.db"
+TOKEN_PARAM = "session"
+TOKEN_PATTERN = re.compile(r"^[A-Za-z0-9_-]{16,64}$")
+# Sessions expire this long after their last change
+SESSION_TTL_S = 7 * 24 * 3600
+# Encoded values at least this big are zlib-compressed when that makes them smaller
+COMPRESS_MIN_BYTES = 1024
+# Values bigger than this stay in this process only
+MAX_VALUE_BYTES = 64 * 1024 * 1024
+# Above this size a value is re-encoded only when it is replaced, not mutated
+# in place (the analyzer results are always replaced wholesale)
+LARGE_VALUE_BYTES = 1024 * 1024
+REDIS_KEY_PREFIX = "portfolio:session:"
+SOCKET_TIMEOUT_S = 5
+BUSY_TIMEOUT_S = 10
+STATE_KEY = "_session_store"
+OWNER_KEY = "_session_owner"
+
+# Session-state keys shared across replicas. Widget values are not listed:
+# Streamlit does not allow setting some of them (buttons, uploaders).
+# The crawl keeps only page metadata here; bodies (crawl_bodies) stay in
+# this process and are re-read from the HTTP cache after a restore.
+PERSISTED_KEYS = [
+    "current_question", "answers", "quiz_completed",  # Dark Triad quiz
+    "sentiment_batch",                                # Sentiment Analyzer batch result
+    "crawl_results", "crawl_elapsed",                 # Web Scraper crawl
+]
+
+
+class SessionBackendError(Exception):
+    """The session store rejected a command."""
+
+
+# --- Serialization ---
+# Values are stored as JSON, never pickled: a blob in a shared store must not
+# be able to run code in whichever replica loads it. Besides JSON types,
+# bytes (base64) and small DataFrames (as records) are encoded with a
+# one-key tag object; anything else stays in this process only.
+
+def _encode_default(value: Any) -> Any:
+    """json.dumps fallback for the non-JSON values kept in session state."""
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": base64.b64encode(value).decode("ascii")}
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(value, pd.DataFrame):
+        return {"__frame__": {"columns": [str(column) for column in value.columns],
+                              "records": value.to_dict(orient="records")}}
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} values cannot be stored in the session backend")
+
+
+def _decode_object(obj: Dict[str, Any]) -> Any:
+    """json.loads object_hook: the inverse of _encode_default for tagged objects."""
+    if len(obj) == 1:
+        if "__bytes__" in obj:
+            return base64.b64decode(obj["__bytes__"])
+        if "__frame__" in obj:
+            import pandas as pd
+
+            frame = obj["__frame__"]
+            return pd.DataFrame.from_records(frame["records"], columns=frame["columns"])
+    return obj
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, default=_encode_default, separators=(",", ":"),
+                      allow_nan=False).encode("utf-8")
+
+
+def _pack(data: bytes) -> bytes:
+    """Tag encoded JSON with one byte: b'Z' for zlib-compressed, b'J' for plain."""
+    if len(data) >= COMPRESS_MIN_BYTES:
+        packed = zlib.compress(data, 6)
+        if len(packed) < len(data):
+            return b"Z" + packed
+    return b"J" + data
+
+
+def _unpack(blob: bytes) -> bytes:
+    kind, data = blob[:1], blob[1:]
+    if kind == b"Z":
+        return zlib.decompress(data)
+    if kind == b"J":
+        return data
+    raise ValueError(f"Unknown session value encoding {kind!r}.")
+
+
+def _decode(data: bytes) -> Any:
+    return json.loads(data, object_hook=_decode_object)
+
+
+def dumps(value: Any) -> bytes:
+    """Compact bytes for one session value."""
+    return _pack(_encode(value))
+
+
+def loads(blob: bytes) -> Any:
+    """Inverse of dumps()."""
+    return _decode(_unpack(blob))
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+# --- Backends ---
+
+class SqliteSessionBackend:
+    """Sessions in a local SQLite file, one row per (session, key); WAL so replicas on one host can share it."""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS session_values (
+        session_id TEXT NOT NULL,
+        key        TEXT NOT NULL,
+        value      BLOB NOT NULL,
+        touched_at REAL NOT NULL,             -- unix time of the session's last write
+        PRIMARY KEY (session_id, key)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_session_values_touched ON session_values (touched_at);
+    """
+
+    def __init__(self, path: str = DB_PATH, ttl_s: int = SESSION_TTL_S):
+        # Imported here so the Redis and in-process modes never load sqlite3
+        import sqlite3
+
+        self.ttl_s = ttl_s
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None,
+                                    timeout=BUSY_TIMEOUT_S)
+        self._lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self.purge_expired()
+
+    def load(self, session_id: str) -> Dict[str, bytes]:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT key, value FROM session_values WHERE session_id = ? AND touched_at >= ?",
+                (session_id, time.time() - self.ttl_s)
+            ).fetchall()
+        return dict(rows)
+
+    def save(self, session_id: str, changed: Dict[str, bytes], deleted: Sequence[str] = ()):
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.executemany(
+                    """INSERT INTO session_values (session_id, key, value, touched_at) VALUES (?, ?, ?, ?)
+                       ON CONFLICT (session_id, key) DO UPDATE
+                       SET value = excluded.value, touched_at = excluded.touched_at""",
+                    [(session_id, key, value, now) for key, value in changed.items()]
+                )
+                self.conn.executemany("DELETE FROM session_values WHERE session_id = ? AND key = ?",
+                                      [(session_id, key) for key in deleted])
+                # Keep the session's unchanged keys alive as long as the changed ones
+                self.conn.execute("UPDATE session_values SET touched_at = ? WHERE session_id = ?", (now, session_id))
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            return self.conn.execute("DELETE FROM session_values WHERE touched_at < ?",
+                                     (time.time() - self.ttl_s,)).rowcount
+
+
+class RespConnection:
+    """
+    Minimal client for the Redis serialization protocol (RESP2).
+
+    Enough for the handful of hash commands the backend needs, so it works
+    against Redis, Valkey, KeyDB or a local stand-in without a client
+    library. Commands are pipelined: one write, then one read per reply.
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0,
+                 password: Optional[str] = None, timeout: float = SOCKET_TIMEOUT_S):
+        self.host, self.port, self.db, self.password, self.timeout = host, port, db, password, timeout
+        self._sock = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        try:
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._file = self._sock.makefile("rb")
+            setup = []
+            if self.password:
+                setup.append(("AUTH", self.password))
+            if self.db:
+                setup.append(("SELECT", self.db))
+            if setup:
+                self._roundtrip(setup)
+        except BaseException:
+            # Never keep a socket that is unauthenticated or on the wrong db.
+            self.close()
+            raise
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = self._file = None
+
+    @staticmethod
+    def _encode(command: Sequence[Any]) -> bytes:
+        parts = [b"*%d\r\n" % len(command)]
+        for arg in command:
+            if isinstance(arg, str):
+                arg = arg.encode("utf-8")
+            elif isinstance(arg, int):
+                arg = str(arg).encode("ascii")
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    def _read_reply(self) -> Any:
+        line = self._file.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Session server closed the connection.")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            return SessionBackendError(rest.decode())
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            length = int(rest)
+            if length < 0:
+                return None
+            data = self._file.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError("Session server closed the connection.")
+            return data[:-2]
+        if kind == b"*":
+            length = int(rest)
+            return None if length < 0 else [self._read_reply() for _ in range(length)]
+        raise SessionBackendError(f"Unexpected reply from session server: {line[:40]!r}")
+
+    def _roundtrip(self, commands: Sequence[Sequence[Any]]) -> List[Any]:
+        self._sock.sendall(b"".join(self._encode(command) for command in commands))
+        replies = [self._read_reply() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, SessionBackendError):
+                raise reply
+        return replies
+
+    def execute(self, *commands: Sequence[Any]) -> List[Any]:
+        """Send commands in one pipeline; reconnects once if the connection dropped."""
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    return self._roundtrip(commands)
+                except (ConnectionError, OSError):
+                    self.close()
+                    if attempt:
+                        raise
+
+
+class RedisSessionBackend:
+    """Sessions as Redis hashes (one field per key), expiring SESSION_TTL_S after the last write."""
+
+    def __init__(self, connection: RespConnection, ttl_s: int = SESSION_TTL_S, prefix: str = REDIS_KEY_PREFIX):
+        self.connection = connection
+        self.ttl_s = ttl_s
+        self.prefix = prefix
+
+    def load(self, session_id: str) -> Dict[str, bytes]:
+        (fields,) = self.connection.execute(("HGETALL", self.prefix + session_id))
+        fields = fields or []
+        return {fields[i].decode("utf-8"): fields[i + 1] for i in range(0, len(fields), 2)}
+
+    def save(self, session_id: str, changed: Dict[str, bytes], deleted: Sequence[str] = ()):
+        name = self.prefix + session_id
+        commands = []
+        if changed:
+            commands.append(("HSET", name, *[part for item in changed.items() for part in item]))
+        if deleted:
+            commands.append(("HDEL", name, *deleted))
+        commands.append(("EXPIRE", name, self.ttl_s))
+        self.connection.execute(*commands)
+
+
+def open_backend(url: str):
+    """Backend for a PORTFOLIO_SESSION_BACKEND value; None means state stays in process memory."""
+    url = url.strip()
+    if url.lower() in ("off", "none", "memory"):
+        return None
+    if not url:
+        return SqliteSessionBackend()
+    if url.startswith("sqlite:///"):
+        return SqliteSessionBackend(url[len("sqlite:///"):] or DB_PATH)
+    parsed = urlparse(url)
+    if parsed.scheme == "redis":
+        db = parsed.path.strip("/")
+        connection = RespConnection(parsed.hostname or "localhost", parsed.port or 6379, int(db or 0),
+                                    unquote(parsed.password) if parsed.password else None)
+        return RedisSessionBackend(connection)
+    raise ValueError(f"Unsupported {BACKEND_ENV} '{url}'; use sqlite:///path, redis://host:port/db or off.")
+
+
+@st.cache_resource
+def get_session_backend():
+    """The process-wide session backend chosen by PORTFOLIO_SESSION_BACKEND."""
+    return open_backend(os.environ.get(BACKEND_ENV, ""))
+
+
+# --- Per-session write-through ---
+
+def _new_token() -> str:
+    return secrets.token_urlsafe(24)
+
+
+def attach_session(keys: Iterable[str] = PERSISTED_KEYS) -> Optional[str]:
+    """
+    Bind this browser session to its resume token; returns the token.
+
+    On the first rerun (or when the URL's token changes) the stored keys
+    are restored into st.session_state. A missing or malformed token is
+    replaced by a new one, written back to the URL.
+    """
+    backend = get_session_backend()
+    if backend is None:
+        return None
+    state = st.session_state.get(STATE_KEY)
+    token = st.query_params.get(TOKEN_PARAM)
+    if token is not None and not TOKEN_PATTERN.match(token):
+        token = None
+
+    if state is None or (token is not None and token != state["id"]):
+        state = {"id": token or _new_token(), "digests": {}, "large": {}}
+        if token is not None:
+            keys = list(keys)
+            try:
+                stored = backend.load(token)
+            except Exception:
+                logger.exception("Could not load session %s; starting from local state", token[:8])
+                stored = {}
+            for key in keys:
+                st.session_state.pop(key, None)
+            for key, blob in stored.items():
+                if key not in keys:
+                    continue
+                try:
+                    data = _unpack(blob)
+                    st.session_state[key] = _decode(data)
+                except Exception:
+                    logger.exception("Could not restore session key %r", key)
+                    continue
+                state["digests"][key] = _digest(data)
+        st.session_state[STATE_KEY] = state
+
+    if st.query_params.get(TOKEN_PARAM) != state["id"]:
+        st.query_params[TOKEN_PARAM] = state["id"]
+    return state["id"]
+
+
+def session_owner() -> str:
+    """
+    Id of this browser session for data kept outside session state, such as database rows.
+
+    This is the resume token when a backend is configured, so a resumed
+    session finds its own rows in any database it wrote them to; with the
+    backend off it is a random id that lasts as long as the browser session.
+    The rows themselves are not in the session store: replicas only share
+    them if they open the same database (see PORTFOLIO_LEDGER_DB).
+    """
+    state = st.session_state.get(STATE_KEY)
+    if state is not None:
+        return state["id"]
+    if OWNER_KEY not in st.session_state:
+        st.session_state[OWNER_KEY] = _new_token()
+    return st.session_state[OWNER_KEY]
+
+
+def flush_session(keys: Iterable[str] = PERSISTED_KEYS) -> int:
+    """
+    Write the keys whose value changed since the last flush; returns how many were written or deleted.
+
+    Values are compared by the digest of their encoding, so in-place edits
+    (answers.append) are caught. Values of LARGE_VALUE_BYTES or more are
+    only re-encoded when the object itself was replaced. On a backend
+    error the state stays local and the write is retried on the next flush.
+    """
+    backend = get_session_backend()
+    state = st.session_state.get(STATE_KEY)
+    if backend is None or state is None:
+        return 0
+
+    changed: Dict[str, bytes] = {}
+    digests: Dict[str, Optional[bytes]] = {}
+    for key in keys:
+        if key not in st.session_state:
+            if key in state["digests"]:
+                digests[key] = None
+            continue
+        value = st.session_state[key]
+        if state["large"].get(key) is value:
+            continue
+        try:
+            data = _encode(value)
+        except (TypeError, ValueError):
+            logger.warning("Session key %r cannot be encoded; keeping it in this process only", key)
+            continue
+        digest = _digest(data)
+        if state["digests"].get(key) == digest:
+            continue
+        blob = _pack(data)
+        if len(blob) > MAX_VALUE_BYTES:
+            logger.warning("Session key %r is %d bytes; keeping it in this process only", key, len(blob))
+            continue
+        changed[key] = blob
+        digests[key] = digest
+        if len(data) >= LARGE_VALUE_BYTES:
+            state["large"][key] = value
+        else:
+            state["large"].pop(key, None)
+
+    deleted = [key for key, digest in digests.items() if digest is None]
+    if not changed and not deleted:
+        return 0
+    try:
+        backend.save(state["id"], changed, deleted)
+    except Exception:
+        logger.exception("Could not save session %s", state["id"][:8])
+        for key in changed:
+            state["large"].pop(key, None)
+        return 0
+    for key, digest in digests.items():
+        if digest is None:
+            state["digests"].pop(key, None)
+            state["large"].pop(key, None)
+        else:
+            state["digests"][key] = digest
+    return len(changed) + len(deleted)
+
+
+@contextlib.contextmanager
+def persisted_session(keys: Iterable[str] = PERSISTED_KEYS) -> Iterator[Optional[str]]:
+    """Restore the session at the start of a rerun and write its changes through at the end."""
+    keys = list(keys)
+    token = attach_session(keys)
+    try:
+        yield token
+    finally:
+        flush_session(keys)
+
+
+def _resume_from_input():
+    """Resume-box callback: switch the URL to the pasted token; attach_session() restores it."""
+    token = st.session_state.get("_resume_token", "").strip()
+    st.session_state["_resume_token"] = ""
+    if TOKEN_PATTERN.match(token):
+        st.query_params[TOKEN_PARAM] = token
+    else:
+        st.toast("That is not a valid session token.")
+
+
+def render_resume_box():
+    """Sidebar expander showing this session's resume token, with a box to paste another one."""
+    state = st.session_state.get(STATE_KEY)
+    if state is None:
+        return
+    with st.sidebar.expander("🔑 Resume Session"):
+        st.caption("Keep this token (or bookmark the page) to pick up your quiz and results later, on any device.")
+        st.code(state["id"], language=None)
+        st.text_input("Resume a session:", key="_resume_token", on_change=_resume_from_input,
+                      placeholder="Paste a session token")
@@ -0,0 +1 @@
+"""Crawling and extraction behind the Web Scraper page (Project 2)."""
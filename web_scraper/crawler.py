@@ -0,0 +1,393 @@
+# Crawl engine for the Web Scraper.
+# A bounded thread pool fetches pages over per-thread keep-alive sessions,
+# a single dispatcher enforces per-host concurrency and delay limits plus each
+# host's robots.txt, and an on-disk SQLite HTTP cache turns re-crawls into
+# conditional GETs that mostly come back 304 Not Modified.
+
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib import robotparser
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+import requests
+import streamlit as st
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+
+# --- Configuration ---
+CACHE_PATH = "http_cache.db"
+USER_AGENT = "LisaSilvaPortfolioScraper/1.0 (+https://github.com/lisa-silva/web-scraper)"
+MAX_WORKERS = 32
+MAX_PER_HOST = 4
+HOST_DELAY_S = 0.1           # minimum gap between request starts to one host
+REQUEST_TIMEOUT_S = 15
+MAX_BODY_BYTES = 5_000_000
+ROBOTS_TTL_S = 3600
+DEFAULT_PORTS = {"http": 80, "https": 443}
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_eid")
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url           TEXT PRIMARY KEY,
+    etag          TEXT,
+    last_modified TEXT,
+    content_type  TEXT,
+    body          BLOB NOT NULL,
+    fetched_at    REAL NOT NULL             -- unix time of the last 200 or 304
+);
+"""
+
+
+def _remove_dot_segments(path: str) -> str:
+    """RFC 3986 section 5.2.4: resolve '.' and '..' path segments."""
+    output: List[str] = []
+    for segment in path.split("/")[1:]:
+        if segment == "..":
+            if output:
+                output.pop()
+        elif segment != ".":
+            output.append(segment)
+    trailing = path.endswith(("/.", "/.."))
+    return "/" + "/".join(output) + ("/" if trailing and output else "")
+
+
+def normalize_url(url: str, base: Optional[str] = None) -> Optional[str]:
+    """
+    Canonical form of an http(s) URL, or None for anything we should not fetch.
+
+    Resolves it against `base`, lowercases scheme and host, drops default
+    ports, credentials and the fragment, resolves dot segments, and sorts the
+    query string minus common tracking parameters, so trivially different
+    spellings of one page dedupe to a single frontier entry.
+    """
+    try:
+        parts = urlsplit(urljoin(base, url.strip()) if base else url.strip())
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return None
+
+    netloc = parts.hostname.lower()
+    if port and port != DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+    path = _remove_dot_segments(parts.path) if parts.path else "/"
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAMS)
+    ))
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def host_of(url: str) -> str:
+    """scheme://host[:port] of a normalized URL; the unit for politeness limits."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class Frontier:
+    """
+    URLs waiting to be fetched, queued per host and deduplicated on their normalized form.
+
+    pop() rotates across hosts and skips any host the caller says is not
+    ready, so one slow or rate-limited site never blocks the others.
+    """
+
+    def __init__(self):
+        self._queues: Dict[str, deque] = {}
+        self._seen = set()
+        self._size = 0
+
+    def add(self, url: str, depth: int) -> bool:
+        """Queue a normalized URL unless it has been seen before."""
+        if url in self._seen:
+            return False
+        self._seen.add(url)
+        self._queues.setdefault(host_of(url), deque()).append((url, depth))
+        self._size += 1
+        return True
+
+    def mark_seen(self, url: str):
+        """Record a URL (e.g. a redirect target) without queueing it."""
+        self._seen.add(url)
+
+    def pop(self, ready: Callable[[str], bool]) -> Optional[Tuple[str, int]]:
+        """Next (url, depth) from the first ready host, round-robin; None if no host is ready."""
+        for host in list(self._queues):
+            if ready(host):
+                queue = self._queues.pop(host)
+                item = queue.popleft()
+                if queue:
+                    # Re-inserting moves the host to the back of the rotation.
+                    self._queues[host] = queue
+                self._size -= 1
+                return item
+        return None
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class HostLimiter:
+    """Per-host in-flight cap and minimum delay between request starts; used by the dispatcher only."""
+
+    def __init__(self, max_per_host: int, delay_for: Callable[[str], float]):
+        self.max_per_host = max_per_host
+        self.delay_for = delay_for
+        self._active: Dict[str, int] = {}
+        self._next_start: Dict[str, float] = {}
+
+    def ready(self, host: str) -> bool:
+        return (self._active.get(host, 0) < self.max_per_host
+                and time.monotonic() >= self._next_start.get(host, 0.0))
+
+    def acquire(self, host: str):
+        self._active[host] = self._active.get(host, 0) + 1
+        self._next_start[host] = time.monotonic() + self.delay_for(host)
+
+    def release(self, host: str):
+        self._active[host] -= 1
+
+
+class HttpCache:
+    """
+    On-disk response cache keyed on normalized URL.
+
+    Only 200 responses carrying an ETag or Last-Modified are stored, since
+    those are the ones a conditional GET can revalidate.
+    """
+
+    def __init__(self, path: str = CACHE_PATH):
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(CACHE_SCHEMA)
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, content_type, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"etag": row[0], "last_modified": row[1], "content_type": row[2], "body": row[3]}
+
+    def put(self, url: str, response: requests.Response, body: bytes):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
+        with self._lock:
+            self.conn.execute(
+                """INSERT INTO responses (url, etag, last_modified, content_type, body, fetched_at)
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (url) DO UPDATE SET
+                       etag = excluded.etag, last_modified = excluded.last_modified,
+                       content_type = excluded.content_type, body = excluded.body,
+                       fetched_at = excluded.fetched_at""",
+                (url, etag, last_modified, response.headers.get("Content-Type", ""), body, time.time())
+            )
+
+    def touch(self, url: str):
+        """Mark a cached entry as revalidated by a 304."""
+        with self._lock:
+            self.conn.execute("UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url))
+
+    def stats(self) -> Tuple[int, int]:
+        """(entries, total body bytes) currently cached."""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM responses").fetchone()
+
+    def clear(self):
+        with self._lock:
+            self.conn.execute("DELETE FROM responses")
+
+
+class RobotsCache:
+    """One parsed robots.txt per host, fetched on first use and kept for ROBOTS_TTL_S."""
+
+    def __init__(self, user_agent: str = USER_AGENT):
+        self.user_agent = user_agent
+        self._parsers: Dict[str, Tuple[float, robotparser.RobotFileParser]] = {}
+        self._host_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _parser(self, session: requests.Session, host: str) -> robotparser.RobotFileParser:
+        with self._lock:
+            host_lock = self._host_locks.setdefault(host, threading.Lock())
+        # Per-host lock: concurrent first requests to a host fetch robots.txt once.
+        with host_lock:
+            cached = self._parsers.get(host)
+            if cached and time.monotonic() - cached[0] < ROBOTS_TTL_S:
+                return cached[1]
+            parser = robotparser.RobotFileParser(f"{host}/robots.txt")
+            try:
+                response = session.get(parser.url, timeout=REQUEST_TIMEOUT_S)
+                status = response.status_code
+            except requests.RequestException:
+                status = None
+            if status in (401, 403):
+                parser.disallow_all = True
+            elif status is not None and status < 300:
+                parser.parse(response.text.splitlines())
+            else:
+                # Missing or unreachable robots.txt means no restrictions.
+                parser.allow_all = True
+            self._parsers[host] = (time.monotonic(), parser)
+            return parser
+
+    def allowed(self, session: requests.Session, url: str) -> bool:
+        return self._parser(session, host_of(url)).can_fetch(self.user_agent, url)
+
+    def crawl_delay(self, host: str) -> Optional[float]:
+        """The host's Crawl-delay, if its robots.txt has been read and sets one."""
+        cached = self._parsers.get(host)
+        if cached is None:
+            return None
+        delay = cached[1].crawl_delay(self.user_agent)
+        return float(delay) if delay is not None else None
+
+
+def extract_links(body: bytes, base_url: str) -> List[str]:
+    """Normalized absolute URLs of every <a href> on a page; only anchor tags are parsed."""
+    soup = BeautifulSoup(body, "html.parser", parse_only=SoupStrainer("a", href=True))
+    links = (normalize_url(anchor["href"], base_url) for anchor in soup.find_all("a"))
+    return [link for link in links if link]
+
+
+class Crawler:
+    """
+    Breadth-first crawler shared by every session (see get_crawler).
+
+    The worker pool and its keep-alive sessions live as long as the process,
+    so connections opened by one crawl are reused by the next.
+    """
+
+    def __init__(self, cache: Optional[HttpCache] = None, max_workers: int = MAX_WORKERS):
+        self.cache = cache if cache is not None else HttpCache()
+        self.robots = RobotsCache()
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="crawler")
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        """This worker thread's pooled keep-alive session."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=64, pool_maxsize=MAX_PER_HOST)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["User-Agent"] = USER_AGENT
+            self._local.session = session
+        return session
+
+    def fetch(self, url: str, follow_links: bool) -> Dict[str, Any]:
+        """
+        Fetch one normalized URL, revalidating any cached copy.
+
+        Never raises: network errors and robots.txt refusals are reported in
+        the result's `error` field.
+        """
+        started = time.perf_counter()
+        result = {"url": url, "final_url": url, "status": None, "from_cache": False,
+                  "content_type": "", "bytes": 0, "elapsed_s": 0.0, "error": None,
+                  "body": b"", "links": []}
+        session = self._session()
+        try:
+            if not self.robots.allowed(session, url):
+                result["error"] = "Disallowed by robots.txt"
+                return result
+
+            cached = self.cache.get(url)
+            headers = {}
+            if cached and cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached and cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+            with session.get(url, headers=headers, timeout=REQUEST_TIMEOUT_S, stream=True) as response:
+                result["status"] = response.status_code
+                result["final_url"] = normalize_url(response.url) or url
+                if response.status_code == 304 and cached:
+                    # Consuming the empty body hands the connection back to the pool.
+                    response.content
+                    self.cache.touch(url)
+                    result.update(from_cache=True, content_type=cached["content_type"], body=cached["body"])
+                else:
+                    body = response.raw.read(MAX_BODY_BYTES, decode_content=True)
+                    result.update(content_type=response.headers.get("Content-Type", ""), body=body)
+                    if response.status_code == 200:
+                        self.cache.put(url, response, body)
+        except requests.RequestException as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        finally:
+            result["bytes"] = len(result["body"])
+            result["elapsed_s"] = time.perf_counter() - started
+
+        if follow_links and result["body"] and "html" in result["content_type"]:
+            result["links"] = extract_links(result["body"], result["final_url"])
+        return result
+
+    def _host_delay(self, host: str) -> float:
+        return max(HOST_DELAY_S, self.robots.crawl_delay(host) or 0.0)
+
+    def crawl(self, seeds: Iterable[str], max_pages: int = 100, max_depth: int = 1,
+              same_host: bool = True, concurrency: int = MAX_WORKERS,
+              max_per_host: int = MAX_PER_HOST) -> Iterator[Dict[str, Any]]:
+        """
+        Crawl breadth-first from the seed URLs, yielding each result as it completes.
+
+        Up to `concurrency` requests are in flight at once, at most
+        `max_per_host` of them to any one host. Links are followed up to
+        `max_depth` hops, staying on the seeds' hosts when `same_host` is set.
+        """
+        frontier = Frontier()
+        seed_urls = [url for url in map(normalize_url, seeds) if url]
+        for url in seed_urls:
+            frontier.add(url, 0)
+        allowed_hosts = {host_of(url) for url in seed_urls}
+        limiter = HostLimiter(max_per_host, self._host_delay)
+        concurrency = max(1, min(concurrency, self.max_workers))
+        in_flight: Dict[Future, Tuple[str, int]] = {}
+        dispatched = 0
+
+        while in_flight or (frontier and dispatched < max_pages):
+            while len(in_flight) < concurrency and dispatched < max_pages:
+                item = frontier.pop(limiter.ready)
+                if item is None:
+                    break
+                url, depth = item
+                limiter.acquire(host_of(url))
+                future = self._executor.submit(self.fetch, url, depth < max_depth)
+                in_flight[future] = (url, depth)
+                dispatched += 1
+
+            if not in_flight:
+                # Everything queued is waiting on a host delay.
+                time.sleep(HOST_DELAY_S / 4)
+                continue
+
+            done, _ = wait(in_flight, timeout=HOST_DELAY_S, return_when=FIRST_COMPLETED)
+            for future in done:
+                url, depth = in_flight.pop(future)
+                limiter.release(host_of(url))
+                result = future.result()
+                result["depth"] = depth
+                frontier.mark_seen(result["final_url"])
+                for link in result.pop("links"):
+                    if not same_host or host_of(link) in allowed_hosts:
+                        frontier.add(link, depth + 1)
+                yield result
+
+
+@st.cache_resource
+def get_crawler() -> Crawler:
+    """The process-wide crawler, with its worker pool and HTTP cache opened once."""
+    return Crawler()
@@ -0,0 +1,197 @@
+# Extraction pipeline for the Web Scraper.
+# Declarative rules map CSS selectors to output fields. Pages are parsed with
+# lxml when it is installed, only the subtrees matching the item selector are
+# built where the selector allows it, and batches of pages are spread over a
+# process pool so extraction uses every core instead of one GIL.
+
+import csv
+import functools
+import itertools
+import json
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+# --- Configuration ---
+EXTRACT_WORKERS = os.cpu_count() or 1
+PAGES_PER_TASK = 16
+OUTPUT_FORMATS = ["jsonl", "csv"]
+URL_ATTRIBUTES = {"href", "src", "action"}
+
+EXAMPLE_RULES = {
+    "item": "article",
+    "fields": {
+        "title": "h1, h2, h3",
+        "link": "a@href",
+        "text": "p",
+    },
+}
+
+# A lone tag, .class or #id (optionally tag.class / tag#id) can be turned
+# into a SoupStrainer so the parser only builds those subtrees.
+SIMPLE_SELECTOR = re.compile(r"^([A-Za-z][\w-]*)?(?:([.#])([\w-]+))?$")
+
+
+def parse_rules(rules: Any) -> Dict[str, Any]:
+    """
+    Validate extraction rules given as a dict or JSON text.
+
+    `item` is an optional CSS selector for repeating records (one record per
+    page when empty). Each field is 'selector' for the element's text,
+    'selector@attr' for an attribute, or '@attr' for an attribute of the item
+    itself. Raises ValueError describing the first problem found.
+    """
+    if isinstance(rules, str):
+        try:
+            rules = json.loads(rules)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Rules are not valid JSON: {e}") from e
+    if not isinstance(rules, dict) or not isinstance(rules.get("fields"), dict) or not rules["fields"]:
+        raise ValueError('Rules need a non-empty "fields" object mapping names to CSS selectors.')
+    item = rules.get("item") or ""
+    if not isinstance(item, str):
+        raise ValueError('"item" must be a CSS selector string.')
+
+    fields = {}
+    probe = BeautifulSoup("", "html.parser")
+    for name, spec in rules["fields"].items():
+        if not isinstance(spec, str) or not spec.strip():
+            raise ValueError(f"Field '{name}' needs a selector string.")
+        selector, _, attribute = spec.strip().partition("@")
+        selector = selector.strip()
+        try:
+            if selector:
+                probe.select_one(selector)
+        except Exception as e:
+            raise ValueError(f"Field '{name}' has an invalid selector '{selector}': {e}") from e
+        fields[str(name)] = (selector, attribute.strip())
+    if item:
+        try:
+            probe.select_one(item)
+        except Exception as e:
+            raise ValueError(f"Invalid item selector '{item}': {e}") from e
+    return {"item": item, "fields": fields}
+
+
+def _strainer(item: str) -> Optional[SoupStrainer]:
+    """SoupStrainer equivalent to a simple item selector, or None to parse the whole page."""
+    match = SIMPLE_SELECTOR.match(item.strip())
+    if not item or not match:
+        return None
+    tag, kind, value = match.groups()
+    attrs = {} if kind is None else {("class" if kind == "." else "id"): value}
+    return SoupStrainer(tag or True, attrs=attrs)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile(rules_json: str) -> Tuple[Dict[str, Any], Optional[SoupStrainer]]:
+    """Rules and strainer, built once per worker process for each rule set."""
+    rules = json.loads(rules_json)
+    return rules, _strainer(rules["item"])
+
+
+def extract_page(url: str, body: bytes, rules: Dict[str, Any],
+                 strainer: Optional[SoupStrainer] = None) -> List[Dict[str, Any]]:
+    """Records extracted from one page with validated rules (see parse_rules)."""
+    soup = BeautifulSoup(body, PARSER, parse_only=strainer)
+    items = soup.select(rules["item"]) if rules["item"] else [soup]
+    records = []
+    for item in items:
+        record = {"url": url}
+        for name, (selector, attribute) in rules["fields"].items():
+            element = item.select_one(selector) if selector else item
+            if element is None:
+                value = None
+            elif attribute:
+                value = element.get(attribute)
+                if isinstance(value, list):
+                    value = " ".join(value)
+                if value and attribute in URL_ATTRIBUTES:
+                    value = urljoin(url, value)
+            else:
+                value = element.get_text(" ", strip=True)
+            record[name] = value
+        records.append(record)
+    # Free the tree now rather than waiting for the cyclic GC.
+    soup.decompose()
+    return records
+
+
+def _extract_batch(pages: List[Tuple[str, bytes]], rules_json: str) -> List[Dict[str, Any]]:
+    """Worker entry point: extract a batch of pages, skipping ones that fail to parse."""
+    rules, strainer = _compile(rules_json)
+    records = []
+    for url, body in pages:
+        try:
+            records.extend(extract_page(url, body, rules, strainer))
+        except Exception as e:
+            records.append({"url": url, "_error": f"{type(e).__name__}: {e}"})
+    return records
+
+
+def _batches(pages: Iterable[Tuple[str, bytes]], size: int) -> Iterator[List[Tuple[str, bytes]]]:
+    batch = []
+    for page in pages:
+        batch.append(page)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def run_extraction(pages: Iterable[Tuple[str, bytes]], rules: Dict[str, Any],
+                   pool: Optional[ProcessPoolExecutor] = None, pages_per_task: int = PAGES_PER_TASK,
+                   max_pending: int = 2 * EXTRACT_WORKERS) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records for (url, body) pages, in page order.
+
+    With a pool, at most `max_pending` batches are in flight at once, so
+    memory stays flat however many pages are fed in. Without one, or when
+    everything fits in a single batch, pages are extracted in this process.
+    """
+    rules_json = json.dumps(rules)
+    batches = _batches(pages, pages_per_task)
+    head = list(itertools.islice(batches, 2))
+    if pool is None or len(head) < 2:
+        for batch in itertools.chain(head, batches):
+            yield from _extract_batch(batch, rules_json)
+        return
+
+    pending = deque()
+    for batch in itertools.chain(head, batches):
+        pending.append(pool.submit(_extract_batch, batch, rules_json))
+        if len(pending) >= max_pending:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def write_records(records: Iterable[Dict[str, Any]], output: TextIO, fmt: str,
+                  fields: Iterable[str]) -> int:
+    """Write records to a text stream as JSONL or CSV as they arrive; returns the count."""
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format '{fmt}'.")
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(output, fieldnames=["url", *fields, "_error"], extrasaction="ignore")
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
+            count += 1
+    else:
+        for record in records:
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    return count
@@ -0,0 +1,143 @@
+# Web Scraper page (Project 2).
+# Loaded by app.py the first time the page is opened.
+
+import io
+import json
+import time
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Tuple
+
+import pandas as pd
+import streamlit as st
+
+from pools import discard_pool, get_pool
+from web_scraper.crawler import MAX_PER_HOST, MAX_WORKERS, HttpCache, get_crawler
+from web_scraper.extract import EXAMPLE_RULES, OUTPUT_FORMATS, parse_rules, run_extraction, write_records
+
+# --- Configuration ---
+# Extracted records previewed on the page (the download has all of them)
+EXTRACT_PREVIEW_ROWS = 200
+
+
+def crawled_pages(results: List[Dict[str, Any]], bodies: Dict[str, bytes],
+                  cache: HttpCache) -> Tuple[List[Tuple[str, bytes]], int]:
+    """
+    (final_url, body) for every crawled HTML page, and how many bodies are gone.
+
+    Bodies come from this session's crawl, or from the on-disk HTTP cache
+    when the crawl was restored from another server process.
+    """
+    pages, missing = [], 0
+    for result in results:
+        if not result["bytes"] or "html" not in result["content_type"]:
+            continue
+        body = bodies.get(result["url"])
+        if body is None:
+            cached = cache.get(result["url"])
+            body = cached["body"] if cached else None
+        if body is None:
+            missing += 1
+        else:
+            pages.append((result["final_url"], body))
+    return pages, missing
+
+
+def render():
+    """Container for the Web Scraper project (Project 2)."""
+    st.title("2. 🕸️ Web Scraper")
+    st.markdown("**(https://github.com/lisa-silva/web-scraper.git)**")
+
+    # Process-wide worker pool, keep-alive sessions and on-disk HTTP cache (see web_scraper/crawler.py)
+    crawler = get_crawler()
+
+    st.header("1. Crawl")
+    seeds = st.text_area("Start URLs (one per line)", placeholder="https://example.com/", key="crawl_seeds")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        max_pages = st.number_input("Max pages", min_value=1, max_value=5000, value=50, key="crawl_max_pages")
+    with col2:
+        max_depth = st.number_input("Link depth", min_value=0, max_value=5, value=1, key="crawl_max_depth")
+    with col3:
+        concurrency = st.slider("Concurrent requests", 1, MAX_WORKERS, 8, key="crawl_concurrency")
+    with col4:
+        per_host = st.slider("Per-host limit", 1, MAX_PER_HOST, 2, key="crawl_per_host")
+    same_host = st.toggle("Stay on the start URLs' sites", value=True, key="crawl_same_host")
+
+    if st.button("Start Crawl", type="primary"):
+        urls = [line for line in seeds.splitlines() if line.strip()]
+        if not urls:
+            st.warning("Please enter at least one start URL.")
+        else:
+            progress = st.progress(0.0, text="Starting crawl...")
+            results, bodies = [], {}
+            start_time = time.perf_counter()
+            for result in crawler.crawl(urls, max_pages=max_pages, max_depth=max_depth, same_host=same_host,
+                                        concurrency=concurrency, max_per_host=per_host):
+                bodies[result["url"]] = result.pop("body")
+                results.append(result)
+                progress.progress(min(len(results) / max_pages, 1.0), text=f"Fetched {len(results):,} pages")
+            progress.empty()
+            # Page metadata is persisted with the session; bodies stay in this process
+            # and fall back to the HTTP cache after a restore (see crawled_pages)
+            st.session_state.crawl_results = results
+            st.session_state.crawl_bodies = bodies
+            st.session_state.crawl_elapsed = time.perf_counter() - start_time
+
+    results = st.session_state.get("crawl_results")
+    if results:
+        pages = pd.DataFrame(results)
+        elapsed = st.session_state.crawl_elapsed
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Pages", f"{len(pages):,}")
+        col2.metric("Revalidated (304)", f"{int(pages['from_cache'].sum()):,}")
+        col3.metric("Errors", f"{int(pages['error'].notna().sum()):,}")
+        col4.metric("Pages / second", f"{len(pages) / max(elapsed, 1e-9):,.1f}")
+        st.dataframe(
+            pages[["url", "status", "from_cache", "depth", "bytes", "elapsed_s", "content_type", "error"]],
+            use_container_width=True,
+            hide_index=True
+        )
+
+        st.header("2. Extract")
+        st.markdown('Map field names to CSS selectors; `selector@attr` reads an attribute. '
+                    '`item` selects the repeating record on each page (leave empty for one record per page).')
+        rules_text = st.text_area("Extraction rules (JSON)", value=json.dumps(EXAMPLE_RULES, indent=2),
+                                  height=200, key="extract_rules")
+        output_format = st.radio("Output format", OUTPUT_FORMATS, horizontal=True, key="extract_format")
+        if st.button("Run Extraction"):
+            try:
+                rules = parse_rules(rules_text)
+            except ValueError as e:
+                st.error(f"Invalid rules: {e}")
+            else:
+                html_pages, missing = crawled_pages(results, st.session_state.get("crawl_bodies", {}), crawler.cache)
+                if missing:
+                    st.warning(f"{missing:,} pages are no longer cached on this server; crawl again to extract them.")
+                preview = []
+
+                def keep_preview(records):
+                    for record in records:
+                        if len(preview) < EXTRACT_PREVIEW_ROWS:
+                            preview.append(record)
+                        yield record
+
+                start_time = time.perf_counter()
+                output = io.StringIO()
+                pool = get_pool()
+                try:
+                    # Records are written out as worker processes finish each batch of pages
+                    count = write_records(keep_preview(run_extraction(html_pages, rules, pool=pool)),
+                                          output, output_format, rules["fields"])
+                except BrokenProcessPool:
+                    discard_pool(pool)
+                    st.error("An extraction worker exited unexpectedly. "
+                             "Press Run Extraction again to retry with fresh workers.")
+                else:
+                    elapsed = time.perf_counter() - start_time
+                    st.success(f"Extracted {count:,} records from {len(html_pages):,} pages in {elapsed:.2f}s.")
+                    st.dataframe(pd.DataFrame(preview), use_container_width=True, hide_index=True)
+                    st.download_button(f"Download {output_format.upper()}", output.getvalue(),
+                                       file_name=f"extracted.{output_format}")
+
+    entries, cached_bytes = crawler.cache.stats()
+    st.caption(f"HTTP cache: {entries:,} pages, {cached_bytes / 1_000_000:,.1f} MB.")